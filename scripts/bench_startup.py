@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark for chair.py subcommands.
+
+Each subcommand's module is imported in a fresh interpreter, so the time
+measured is what a user waits before the command starts doing work. Also
+reports which heavy dependencies got imported along the way — none of them
+should load until a command actually needs them.
+
+Usage:
+    python scripts/bench_startup.py                          # Print a table
+    python scripts/bench_startup.py --json > startup.json    # Save a baseline
+    python scripts/bench_startup.py --baseline startup.json  # Exit 1 on regression
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Subcommand -> module whose import it pays for before running
+TARGETS = {
+    "menu": "directors_chair.cli",
+    "storyboard": "directors_chair.cli.commands.storyboard",
+    "generate": "directors_chair.cli.commands.generation",
+    "clip-tools": "directors_chair.cli.commands.clip_tools",
+    "assemble": "directors_chair.cli.commands.assemble",
+    "voice": "directors_chair.cli.commands.voice",
+}
+
+HEAVY_MODULES = ["torch", "mflux", "mlx", "fal_client", "PIL", "requests", "psutil"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    src = os.path.join(REPO_ROOT, "src")
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH")) if p)
+    return env
+
+
+def measure_import(module: str, repeat: int) -> dict:
+    """Median import time of `module` over `repeat` fresh interpreters.
+
+    Returns:
+        {"median": seconds, "runs": [...], "wall": median process seconds,
+         "heavy": heavy modules loaded}.
+    """
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    runs, walls, heavy = [], [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, cwd=REPO_ROOT, env=_env(),
+        )
+        walls.append(time.perf_counter() - start)
+        if proc.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{proc.stderr.strip()}")
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        runs.append(result["seconds"])
+        heavy = result["heavy"]
+    return {
+        "median": statistics.median(runs),
+        "runs": runs,
+        "wall": statistics.median(walls),
+        "heavy": heavy,
+    }
+
+
+def check_regressions(results: dict, baseline: dict, tolerance: float, slack: float) -> list:
+    """Subcommands whose median import time exceeds the baseline.
+
+    A result regresses when it is slower than ``baseline * (1 + tolerance) + slack``.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        limit = base["median"] * (1 + tolerance) + slack
+        if result["median"] > limit:
+            regressions.append((name, base["median"], result["median"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure chair.py subcommand cold-start time")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per subcommand (default: 5)")
+    parser.add_argument("--only", help="Comma-separated subcommands to measure (default: all)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON (usable as a --baseline)")
+    parser.add_argument("--baseline", help="JSON from an earlier --json run; exit 1 if any subcommand got slower")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown over the baseline as a fraction (default: 0.25)")
+    parser.add_argument("--slack", type=float, default=0.05,
+                        help="Extra seconds allowed on top of the tolerance, for timer noise (default: 0.05)")
+    args = parser.parse_args()
+
+    names = [n.strip() for n in args.only.split(",")] if args.only else list(TARGETS)
+    unknown = [n for n in names if n not in TARGETS]
+    if unknown:
+        parser.error(f"Unknown subcommand(s): {', '.join(unknown)}. Choose from: {', '.join(TARGETS)}")
+
+    results = {name: measure_import(TARGETS[name], max(1, args.repeat)) for name in names}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'subcommand':<12} {'import':>9} {'process':>9}  heavy modules loaded")
+        for name, r in results.items():
+            heavy = ", ".join(r["heavy"]) or "-"
+            print(f"{name:<12} {r['median'] * 1000:>7.0f}ms {r['wall'] * 1000:>7.0f}ms  {heavy}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = check_regressions(results, baseline, args.tolerance, args.slack)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: {before * 1000:.0f}ms -> {after * 1000:.0f}ms", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,11 +24,13 @@ def main():
     sb.add_argument("--keyframes-only", action="store_true", help="Stop after keyframe generation (skip video)")
     sb.add_argument("--regen-keyframes", type=str, help="Comma-separated shot names, 'all' to regen everything, or 'missing' to only generate missing keyframes. e.g. 'hockey_threat,greasy_cigarette'")
     sb.add_argument("--edit-keyframes", type=str, help="Comma-separated shot names to run ONLY the edit pass on existing keyframes. e.g. 'hockey_threat,hockey_face'")
+    sb.add_argument("--concurrency", type=int, help="Max shots processed at once (default: system.max_concurrent_shots in config.json)")
 
     # --- generate subcommand ---
     gen = subparsers.add_parser("generate", help="Generate character images (autonomous)")
     gen.add_argument("--theme", required=True, help="Theme name from config.json")
     gen.add_argument("--count", type=int, help="Override number of images")
+    gen.add_argument("--concurrency", type=int, help="Max cloud image requests at once (default: system.max_concurrent_images in config.json)")
 
     # --- edit-clip subcommand ---
     ec = subparsers.add_parser("edit-clip", help="Edit an existing video clip (v2v)")
@@ -55,6 +57,8 @@ def main():
         help="Comma-separated storyboard names in order (e.g. desert_run,desert_run_zombie)"
     )
     asm.add_argument("--name", required=True, help="Output movie name")
+    asm.add_argument("--audio", action=argparse.BooleanOptionalAction, default=None,
+                     help="Keep clip audio, filling silent clips with silence (default: on if any clip has audio)")
 
     # --- voice subcommand ---
     vp = subparsers.add_parser("voice", help="Voice design and management")
@@ -109,6 +113,7 @@ def main():
             keyframes_only=getattr(args, 'keyframes_only', False) or bool(regen_kf) or bool(edit_kf),
             regen_keyframes=regen_kf,
             edit_keyframes=edit_kf,
+            max_concurrent=args.concurrency,
         )
 
     elif args.command == "generate":
@@ -117,6 +122,7 @@ def main():
             theme_name=args.theme,
             auto_mode=True,
             count_override=args.count,
+            max_concurrent=args.concurrency,
         )
 
     elif args.command == "edit-clip":
@@ -153,6 +159,7 @@ def main():
             clip_names=clip_names,
             movie_name=args.name,
             auto_mode=True,
+            audio=args.audio,
         )
 
     elif args.command == "voice":
@@ -1,11 +1,10 @@
 import sys
 import questionary
 from directors_chair.cli.utils import print_header, console
-from directors_chair.cli.commands.generation import generate_images
-from directors_chair.cli.commands.storyboard import storyboard_to_video
-from directors_chair.cli.commands.clip_tools import clip_tools_menu
-from directors_chair.cli.commands.assemble import assemble_movie
-from directors_chair.cli.commands.voice import voice_menu
+
+# Command modules are imported when picked, so the menu (and every
+# `chair.py <subcommand>`, which imports through this package) starts
+# without loading fal_client, PIL or the local model stacks.
 
 def main_menu():
     while True:
@@ -27,14 +26,19 @@ def main_menu():
             sys.exit(0)
 
         if "1." in choice:
+            from directors_chair.cli.commands.generation import generate_images
             generate_images()
         elif "2." in choice:
+            from directors_chair.cli.commands.storyboard import storyboard_to_video
             storyboard_to_video()
         elif "3." in choice:
+            from directors_chair.cli.commands.clip_tools import clip_tools_menu
             clip_tools_menu()
         elif "4." in choice:
+            from directors_chair.cli.commands.assemble import assemble_movie
             assemble_movie()
         elif "5." in choice:
+            from directors_chair.cli.commands.voice import voice_menu
             voice_menu()
         elif "6." in choice:
             console.print("Goodbye!")
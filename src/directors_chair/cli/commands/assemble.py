@@ -4,15 +4,17 @@ import questionary
 from rich.table import Table
 from directors_chair.config.loader import load_config
 from directors_chair.cli.utils import console
+from directors_chair.video.assembly import concat_clips
 
 
-def assemble_movie(clip_names=None, movie_name=None, auto_mode=False):
+def assemble_movie(clip_names=None, movie_name=None, auto_mode=False, audio=None):
     """Assemble multiple storyboard final videos into a movie.
 
     Args:
         clip_names: List of storyboard names in order (skips selection if provided).
         movie_name: Output movie name (skips naming prompt if provided).
         auto_mode: If True, skip all interactive prompts.
+        audio: Keep audio (silence fills clips without it). None = keep if any clip has audio.
     """
     config = load_config()
     videos_dir = config.get("directories", {}).get("videos", "assets/generated/videos")
@@ -126,35 +128,12 @@ def assemble_movie(clip_names=None, movie_name=None, auto_mode=False):
             if not overwrite:
                 return
 
-    # Stitch with re-encoding to common resolution
+    # Stitch, re-encoding only clips that don't match the common format
     console.print(f"\n[bold]Assembling {len(selected)} clips...[/bold]")
 
     clip_paths = [path for _, path, _ in selected]
-    inputs = []
-    filter_parts = []
-    for i, cp in enumerate(clip_paths):
-        inputs.extend(["-i", os.path.abspath(cp)])
-        filter_parts.append(
-            f"[{i}:v]scale=1280:720:force_original_aspect_ratio=decrease,"
-            f"pad=1280:720:(ow-iw)/2:(oh-ih)/2,setsar=1[v{i}]"
-        )
-
-    stream_labels = "".join(f"[v{i}]" for i in range(len(clip_paths)))
-    filter_parts.append(f"{stream_labels}concat=n={len(clip_paths)}:v=1:a=0[out]")
-    filter_graph = ";".join(filter_parts)
-
-    cmd = [
-        "ffmpeg", "-y",
-        *inputs,
-        "-filter_complex", filter_graph,
-        "-map", "[out]",
-        "-c:v", "libx264", "-crf", "18", "-preset", "fast",
-        "-pix_fmt", "yuv420p",
-        output_path
-    ]
-
     try:
-        subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        concat_clips(clip_paths, output_path, audio=audio)
     except subprocess.CalledProcessError as e:
         console.print(f"[red]ffmpeg failed (exit {e.returncode})[/red]")
         if not auto_mode:
@@ -6,8 +6,9 @@ import questionary
 from rich.table import Table
 from rich.panel import Panel
 from directors_chair.config.loader import load_config
-from directors_chair.storyboard import load_storyboard, validate_storyboard
+from directors_chair.storyboard import get_storyboard
 from directors_chair.cli.utils import console
+from directors_chair.video.metadata import media_info
 
 
 def _select_storyboard(config, storyboard_file=None):
@@ -44,8 +45,8 @@ def _select_storyboard(config, storyboard_file=None):
 
         storyboard_path = os.path.join(storyboard_dir, file_choice)
 
-    storyboard = load_storyboard(storyboard_path)
-    is_valid, errors = validate_storyboard(storyboard)
+    storyboard = get_storyboard(storyboard_path)
+    is_valid, errors = storyboard.validate()
     if not is_valid:
         console.print("[red]Storyboard validation failed:[/red]")
         for err in errors:
@@ -55,32 +56,44 @@ def _select_storyboard(config, storyboard_file=None):
     return storyboard, storyboard_path
 
 
-def _shot_by_name(shots, name):
-    """Find a shot dict by name. Returns (index, shot) or (None, None)."""
-    for i, shot in enumerate(shots):
-        if shot.get("name") == name:
-            return i, shot
-    return None, None
+def _describe_media(path):
+    """'12.3s 1280x720'-style summary of a clip or image (probes it if not cached)."""
+    info = media_info(path) or {}
+    parts = []
+    if info.get("duration"):
+        parts.append(f"{info['duration']:.1f}s")
+    if info.get("width"):
+        parts.append(f"{info['width']}x{info['height']}")
+    return " ".join(parts)
 
 
 def _list_clips(clips_dir, shots):
-    """List available clips and return list of shot names that have clips."""
+    """List available clips and return list of shot names that have clips.
+
+    Duration and resolution come from the media index only; clips that
+    haven't been probed yet show "?" rather than spawning ffprobe per row.
+    """
     shot_names = [s.get("name", f"shot_{i}") for i, s in enumerate(shots)]
     clip_names = []
 
     table = Table(title="Available Clips")
     table.add_column("Shot Name", style="yellow")
     table.add_column("Size", style="dim", width=8)
+    table.add_column("Duration", style="dim", width=8)
+    table.add_column("Resolution", style="dim", width=10)
     table.add_column("Status", style="dim", width=10)
 
     for sname in shot_names:
         clip_path = os.path.join(clips_dir, f"clip_{sname}.mp4")
         if os.path.exists(clip_path):
             size_kb = os.path.getsize(clip_path) // 1024
-            table.add_row(sname, f"{size_kb}KB", "[green]ready[/green]")
+            info = media_info(clip_path, probe=False) or {}
+            duration = f"{info['duration']:.1f}s" if info.get("duration") else "?"
+            resolution = f"{info['width']}x{info['height']}" if info.get("width") else "?"
+            table.add_row(sname, f"{size_kb}KB", duration, resolution, "[green]ready[/green]")
             clip_names.append(sname)
         else:
-            table.add_row(sname, "-", "[red]missing[/red]")
+            table.add_row(sname, "-", "-", "-", "[red]missing[/red]")
 
     console.print(table)
     return clip_names
@@ -96,17 +109,23 @@ def _select_clip(clip_names):
 
 
 def _list_keyframes(keyframes_dir, shots):
-    """List available keyframes."""
+    """List available keyframes (resolution shown only if already in the media index)."""
     table = Table(title="Keyframes")
     table.add_column("Shot Name", style="yellow")
-    table.add_column("Status", style="dim", width=10)
+    table.add_column("Status", style="dim", width=18)
 
     for i, shot in enumerate(shots):
         sname = shot.get("name", f"shot_{i}")
         kf_path = os.path.join(keyframes_dir, f"keyframe_{sname}.png")
         exists = os.path.exists(kf_path)
-        size_kb = os.path.getsize(kf_path) // 1024 if exists else 0
-        status = f"{size_kb}KB" if exists else "[red]missing[/red]"
+        if exists:
+            size_kb = os.path.getsize(kf_path) // 1024
+            info = media_info(kf_path, probe=False) or {}
+            status = f"{size_kb}KB"
+            if info.get("width"):
+                status += f" {info['width']}x{info['height']}"
+        else:
+            status = "[red]missing[/red]"
         table.add_row(sname, status)
     console.print(table)
 
@@ -161,8 +180,11 @@ def edit_clip_command(storyboard_file=None, clip_name=None, edit_prompt=None, au
         console.print(f"[red]Clip not found: {clip_path}[/red]")
         return
 
-    shot_idx, shot = _shot_by_name(shots, clip_name)
+    shot_idx, shot = storyboard.shot(clip_name)
     console.print(f"\n[bold]Editing clip: {clip_name}[/bold]")
+    details = _describe_media(clip_path)
+    if details:
+        console.print(f"  [dim]{details}[/dim]")
 
     # Edit loop
     while True:
@@ -299,9 +321,12 @@ def edit_keyframe_command(storyboard_file=None, keyframe_name=None, edit_prompt=
         return
 
     console.print(f"\n[bold]Editing keyframe: {keyframe_name}[/bold]")
+    details = _describe_media(kf_path)
+    if details:
+        console.print(f"  [dim]{details}[/dim]")
 
     # Scope characters to shot
-    shot_idx, shot = _shot_by_name(shots, keyframe_name)
+    shot_idx, shot = storyboard.shot(keyframe_name)
     shot_characters = characters
     if shot_idx is not None:
         shot_chars = shots[shot_idx].get("characters", [])
@@ -402,7 +427,7 @@ def regen_clip_command(storyboard_file=None, clip_name=None, auto_mode=False):
             return
         clip_name = pick
 
-    shot_idx, shot = _shot_by_name(shots, clip_name)
+    shot_idx, shot = storyboard.shot(clip_name)
     if shot_idx is None:
         console.print(f"[red]Shot '{clip_name}' not found in storyboard.[/red]")
         return
@@ -1,19 +1,18 @@
 import os
-import random
 import json
 import questionary
 from rich.panel import Panel
-from directors_chair.config.loader import load_config, save_config, get_prompt
-from directors_chair.generation import get_generator
+from directors_chair.config.loader import load_config, set_config_entry, get_prompt
 from directors_chair.cli.utils import console
 
-def generate_images(theme_name=None, auto_mode=False, count_override=None):
+def generate_images(theme_name=None, auto_mode=False, count_override=None, max_concurrent=None):
     """Generate character images.
 
     Args:
         theme_name: Theme name from config (skips selection if provided).
         auto_mode: If True, skip all interactive prompts.
         count_override: Override the theme's image count.
+        max_concurrent: Max cloud requests in flight (defaults to system.max_concurrent_images).
     """
     config = load_config()
     themes = config.get("themes", {})
@@ -81,7 +80,7 @@ def generate_images(theme_name=None, auto_mode=False, count_override=None):
 
             if questionary.confirm("Save this theme?").ask():
                 theme_key = f"{trigger}_{name}".replace(" ", "_")
-                config["themes"][theme_key] = {
+                theme_entry = {
                     "trigger": trigger,
                     "prompt_file": prompt_text,
                     "count": count,
@@ -92,7 +91,8 @@ def generate_images(theme_name=None, auto_mode=False, count_override=None):
                         "guidance": guidance
                     }
                 }
-                save_config(config)
+                config["themes"][theme_key] = theme_entry
+                set_config_entry("themes", theme_key, theme_entry)
                 console.print(f"[green]Theme saved as {theme_key}[/green]")
 
         elif choice in themes:
@@ -143,13 +143,19 @@ def generate_images(theme_name=None, auto_mode=False, count_override=None):
     full_prompt = f"{trigger} {name}, {prompt_text}"
 
     # Instantiate Generator
+    from directors_chair.generation import get_generator
     lora_paths_arg = [selected_lora_path] if selected_lora_path else None
     generator = get_generator(generator_choice, lora_paths=lora_paths_arg)
 
-    for i in range(count):
-        current_seed = random.randint(0, 2**32 - 1)
-        console.print(f"  Generating image {i + 1}/{count}...")
-        image = generator.generate(prompt=full_prompt, steps=steps, seed=current_seed)
+    console.print(f"  Generating {count} images...")
+    finished = 0
+    failed = []
+    for i, seed_params, image in generator.generate_many(full_prompt, steps, count, max_concurrent=max_concurrent):
+        finished += 1
+        if isinstance(image, Exception):
+            console.print(f"  [red]Image {i + 1} failed: {image}[/red]")
+            failed.append(i + 1)
+            continue
 
         base_filename = os.path.join(output_dir, f"{name}-{i}")
 
@@ -163,7 +169,7 @@ def generate_images(theme_name=None, auto_mode=False, count_override=None):
         # Save Metadata (For Reproducibility)
         metadata = {
             "prompt": full_prompt,
-            "seed": current_seed,
+            **seed_params,
             "steps": steps,
             "guidance": guidance,
             "generator": generator_choice,
@@ -172,6 +178,10 @@ def generate_images(theme_name=None, auto_mode=False, count_override=None):
         with open(f"{base_filename}.json", "w") as f:
             json.dump(metadata, f, indent=4)
 
+        console.print(f"  [green]Image {i + 1} saved ({finished}/{count} done)[/green]")
+
+    if failed:
+        console.print(f"[yellow]{len(failed)} image(s) failed: {', '.join(map(str, sorted(failed)))}[/yellow]")
     console.print("[bold green]Generation Complete![/bold green]")
     console.print(f"Images saved to: {output_dir}")
     if not auto_mode:
@@ -2,7 +2,7 @@ import os
 import shutil
 import time
 import questionary
-from directors_chair.config.loader import load_config, save_config
+from directors_chair.config.loader import load_config, set_config_entry
 from directors_chair.assets import download_model
 from directors_chair.cli.utils import console
 
@@ -42,7 +42,7 @@ def manage_models():
         
         if action == "Set as Default":
             config["system"]["default_generator"] = choice
-            save_config(config)
+            set_config_entry("system", "default_generator", choice)
             console.print(f"[green]Set {choice} as default generator.[/green]")
             time.sleep(1)
         elif action == "Delete":
@@ -58,7 +58,7 @@ def manage_models():
             if success:
                 if questionary.confirm("Set as default generator?").ask():
                     config["system"]["default_generator"] = choice
-                    save_config(config)
+                    set_config_entry("system", "default_generator", choice)
                 input("\nPress Enter to continue...")
             else:
                 input("\nDownload failed. Press Enter to continue...")
@@ -1,15 +1,20 @@
 import os
 import json
 import subprocess
+from concurrent.futures import Future
 import questionary
 from rich.panel import Panel
 from rich.table import Table
 from directors_chair.config.loader import load_config
-from directors_chair.storyboard import load_storyboard, validate_storyboard
+from directors_chair.storyboard import load_storyboard, validate_storyboard, ShotScheduler, DEFAULT_MAX_CONCURRENT_SHOTS
+from directors_chair.storyboard.manifest import (
+    BuildManifest, fingerprint, file_fingerprint,
+    layout_fingerprint, keyframe_fingerprint, clip_fingerprint,
+)
 from directors_chair.cli.utils import console
 
 
-def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=False, regen_keyframes=None, edit_keyframes=None):
+def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=False, regen_keyframes=None, edit_keyframes=None, max_concurrent=None):
     """Main storyboard pipeline: Layout → Keyframe → Video.
 
     Args:
@@ -18,6 +23,7 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
         keyframes_only: If True, stop after keyframe generation (skip video).
         regen_keyframes: List of 0-indexed shot numbers whose keyframes should be regenerated.
         edit_keyframes: List of 0-indexed shot numbers to run ONLY the edit pass on (skips generation).
+        max_concurrent: Max shots in flight at once (defaults to system.max_concurrent_shots).
     """
     config = load_config()
 
@@ -135,6 +141,33 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
     # Build shot name lookup
     shot_names = [s.get("name", f"shot_{i}") for i, s in enumerate(shots)]
 
+    # Input fingerprints decide what is stale; see storyboard/manifest.py
+    manifest = BuildManifest(output_base)
+
+    from directors_chair.fal import JobJournal, get_job_runner, job_scope
+    job_journal = JobJournal(os.path.join(output_base, "fal_jobs.json"))
+    job_journal.retain_scopes(f"{sname}:{stage}" for sname in shot_names for stage in ("layout", "keyframe", "clip"))
+    pending_jobs = job_journal.pending()
+    if pending_jobs:
+        console.print(
+            f"[cyan]Found {sum(pending_jobs.values())} fal request(s) from an interrupted run "
+            f"({', '.join(sorted(pending_jobs))}) — they will be reattached if their inputs are unchanged.[/cyan]"
+        )
+    video_engine_name = "fal-kling"
+
+    def scoped_characters(shot):
+        """Per-shot character scoping: if shot has a "characters" list, only use those."""
+        if "characters" in shot and isinstance(shot["characters"], list):
+            return {k: characters[k] for k in shot["characters"] if k in characters}
+        return characters
+
+    def keyframe_fp(sname, anchor_kf_path=None):
+        shot = shots[shot_names.index(sname)]
+        return keyframe_fingerprint(
+            shot, scoped_characters(shot), keyframe_engine, kling_params,
+            os.path.join(layouts_dir, f"layout_{sname}.png"), anchor_kf_path,
+        )
+
     # --- Edit-only mode: skip generation, just run edit passes ---
     if edit_keyframes:
         from directors_chair.keyframe import edit_keyframe
@@ -157,9 +190,7 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
                 continue
 
             # Scope characters for this shot
-            shot_characters = characters
-            if "characters" in shot and isinstance(shot["characters"], list):
-                shot_characters = {k: characters[k] for k in shot["characters"] if k in characters}
+            shot_characters = scoped_characters(shot)
 
             console.print(f"\n[bold]Editing keyframe: {sname}[/bold]")
             edit_ok = edit_keyframe(
@@ -171,6 +202,11 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
             )
             if not edit_ok:
                 console.print(f"  [yellow]Edit failed for {sname}, original preserved.[/yellow]")
+            else:
+                # Keep the edited keyframe current for its (possibly new) edit prompt
+                anchor_name = shot.get("anchor_keyframe")
+                anchor_kf = os.path.join(keyframes_dir, f"keyframe_{anchor_name}.png") if anchor_name else None
+                manifest.record(kf_path, keyframe_fp(sname, anchor_kf if anchor_kf and os.path.exists(anchor_kf) else None))
 
         console.print("\n[green]Edit pass complete.[/green]")
         console.print(f"  Keyframes: {keyframes_dir}/")
@@ -188,35 +224,312 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
     else:
         target_names = None  # no filter, process all
 
-    # --- Phase 1: Layout Generation ---
-    console.print(Panel("[bold]Phase 1: Layout Generation[/bold]", border_style="cyan"))
+    if max_concurrent is None:
+        max_concurrent = config.get("system", {}).get("max_concurrent_shots", DEFAULT_MAX_CONCURRENT_SHOTS)
 
-    from directors_chair.layout import generate_layout
+    from directors_chair.layout import submit_layouts
+    from directors_chair.keyframe import generate_keyframe_kling, generate_keyframe_nano_banana, edit_keyframe
 
-    layout_paths = {}  # shot_name -> path
-    for i, shot in enumerate(shots):
-        sname = shot_names[i]
-        layout_path = os.path.join(layouts_dir, f"layout_{sname}.png")
-        layout_paths[sname] = layout_path
+    shot_index = {sname: i for i, sname in enumerate(shot_names)}
+    layout_paths = {sname: os.path.join(layouts_dir, f"layout_{sname}.png") for sname in shot_names}
+    keyframe_paths = {sname: os.path.join(keyframes_dir, f"keyframe_{sname}.png") for sname in shot_names}
+    clip_paths = [os.path.join(clips_dir, f"clip_{sname}.mp4") for sname in shot_names]
+
+    # Delete keyframes marked for regeneration up front, so an anchored shot
+    # never picks up the stale keyframe of a shot that is about to be redone.
+    if isinstance(regen_keyframes, list) or regen_keyframes == "all":
+        for sname in shot_names:
+            if target_names is not None and sname not in target_names:
+                continue
+            kf_path = keyframe_paths[sname]
+            if os.path.exists(kf_path):
+                os.remove(kf_path)
+                console.print(f"  [yellow]Deleted keyframe_{sname}.png for regeneration.[/yellow]")
+
+    # "missing" only fills gaps; otherwise anything built from different inputs is rebuilt
+    only_missing = regen_keyframes == "missing"
+
+    def is_fresh(path, fp):
+        if only_missing:
+            return os.path.exists(path)
+        return manifest.is_fresh(path, fp)
+
+    def report_stale(kind, sname, path):
+        if os.path.exists(path):
+            console.print(f"  [yellow]{kind} {sname} is out of date (inputs changed), rebuilding.[/yellow]")
+
+    # Shots whose layouts this run may build (when targeting specific shots)
+    layout_targets = [sname for sname in shot_names if target_names is None or sname in target_names]
+
+    layout_cache_dir = os.path.join(output_base, "layout_cache")
+
+    def start_layouts(names, refresh=False):
+        """Start generating layout scripts concurrently, rendering them as they arrive.
+
+        Shots whose layout is up to date are skipped. Scripts come from the
+        layout script cache when the prompt and characters are unchanged,
+        unless `refresh` is set. Returns {shot name: Future[bool]} for the
+        shots being built; each future resolves once that shot's layout is
+        rendered and recorded.
+        """
+        todo = []
+        fps = {}
+        for sname in names:
+            fps[sname] = layout_fingerprint(shots[shot_index[sname]], characters)
+            if is_fresh(layout_paths[sname], fps[sname]):
+                console.print(f"  [dim]Layout {sname} up to date, skipping.[/dim]")
+            else:
+                report_stale("Layout", sname, layout_paths[sname])
+                todo.append(sname)
+        if not todo:
+            return {}
+
+        console.print(f"\n[bold]Layouts: generating {len(todo)} script(s)[/bold]")
+        path_futures = submit_layouts(
+            [(shots[shot_index[sname]]["layout_prompt"], layout_paths[sname]) for sname in todo],
+            characters,
+            cache_dir=layout_cache_dir,
+            refresh=refresh,
+        )
+
+        def finish(sname, future):
+            try:
+                ok = future.result()
+            except Exception as e:
+                console.print(f"[red]Layouts failed: {e}[/red]")
+                ok = False
+            if ok:
+                manifest.record(layout_paths[sname], fps[sname])
+            else:
+                console.print(f"[red]Layout generation failed for shot {shot_index[sname] + 1} ({sname}).[/red]")
+            return ok
+
+        def settle(sname, done, future):
+            try:
+                done.set_result(finish(sname, future))
+            except Exception as e:
+                done.set_exception(e)
+
+        shot_futures = {}
+        for sname in todo:
+            done = Future()
+            path_futures[layout_paths[sname]].add_done_callback(
+                lambda f, sname=sname, done=done: settle(sname, done, f)
+            )
+            shot_futures[sname] = done
+        return shot_futures
+
+    def build_layouts(names, refresh=False):
+        """Build layouts for `names` and wait for all of them. Returns the shot names that failed."""
+        futures = start_layouts(names, refresh)
+        return [sname for sname in names if sname in futures and not futures[sname].result()]
+
+    # --- Per-shot stages (run concurrently by ShotScheduler) ---
+    def resolve_anchor(sname):
+        """Path of the shot's anchor keyframe if it exists on disk, else None."""
+        anchor_name = shots[shot_index[sname]].get("anchor_keyframe")
+        anchor_kf = keyframe_paths.get(anchor_name) if anchor_name else None
+        return anchor_kf if anchor_kf and os.path.exists(anchor_kf) else None
+
+    def make_keyframe(sname, anchor_kf_path, num_images=1):
+        """Generate a shot's keyframe from its scoped characters, layout and anchor, then run its edit pass.
+
+        These are exactly the inputs keyframe_fp(sname, anchor_kf_path) covers.
+        """
+        shot = shots[shot_index[sname]]
+        kf_path = keyframe_paths[sname]
+        comp_path = layout_paths[sname]
+        shot_characters = scoped_characters(shot)
+
+        if keyframe_engine == "gemini":
+            ok = generate_keyframe_nano_banana(
+                prompt=shot.get("keyframe_prompt", ""),
+                comp_image_path=comp_path,
+                characters=shot_characters,
+                output_path=kf_path,
+                kling_params=kling_params,
+                anchor_keyframe_path=anchor_kf_path,
+                num_images=num_images,
+            )
+        else:
+            ok = generate_keyframe_kling(
+                prompt=shot.get("keyframe_prompt"),
+                comp_image_path=comp_path,
+                characters=shot_characters,
+                output_path=kf_path,
+                kling_params=kling_params,
+                keyframe_passes=shot.get("keyframe_passes"),
+            )
+        if not ok:
+            console.print(f"[red]Keyframe generation failed for {sname}.[/red]")
+            return False
+
+        # Optional post-generation edit pass
+        edit_prompt = shot.get("keyframe_edit_prompt")
+        if edit_prompt and os.path.exists(kf_path):
+            console.print(f"  [cyan]Applying keyframe edit to {sname}...[/cyan]")
+            edit_ok = edit_keyframe(
+                prompt=edit_prompt,
+                keyframe_path=kf_path,
+                output_path=kf_path,
+                kling_params=kling_params,
+                characters=shot_characters,
+            )
+            if not edit_ok:
+                console.print(f"  [yellow]Keyframe edit failed for {sname}, keeping original.[/yellow]")
+        return True
+
+    layout_futures = {}
+
+    def layout_stage(sname, scheduler):
+        # Layouts are generated in the background; wait for this shot's only
+        future = layout_futures.get(sname)
+        return True if future is None else future.result()
+
+    def keyframe_stage(sname, scheduler):
+        i = shot_index[sname]
+        shot = shots[i]
+        kf_path = keyframe_paths[sname]
 
         # Skip shots not in target list (when targeting specific shots)
         if target_names is not None and sname not in target_names:
-            continue
+            return True
+
+        shot_characters = scoped_characters(shot)
 
-        if os.path.exists(layout_path):
-            console.print(f"  [dim]Layout {sname} already exists, skipping.[/dim]")
-            continue
+        # Determine composition reference and optional anchor keyframe.
+        # An anchored shot waits for that one keyframe, not for earlier shots,
+        # since the anchor image is one of this keyframe's inputs.
+        anchor_kf_path = None
+        anchor_name = shot.get("anchor_keyframe")
+        if anchor_name and anchor_name in keyframe_paths:
+            scheduler.wait_for(anchor_name, "keyframe")
+            anchor_kf = keyframe_paths[anchor_name]
+            if os.path.exists(anchor_kf):
+                anchor_kf_path = anchor_kf
+
+        kf_fp = keyframe_fp(sname, anchor_kf_path)
+        if is_fresh(kf_path, kf_fp):
+            console.print(f"  [dim]Keyframe {sname} up to date, skipping.[/dim]")
+            return True
+        report_stale("Keyframe", sname, kf_path)
+
+        if anchor_name:
+            if anchor_kf_path:
+                console.print(f"  [dim]{sname}: anchor keyframe {anchor_name} (scene/background reference)[/dim]")
+            else:
+                console.print(f"  [yellow]{sname}: anchor keyframe {anchor_name} not found on disk[/yellow]")
+
+        console.print(f"\n[bold]Keyframe {i + 1}/{num_shots}: {sname}[/bold]")
+        if shot_characters is not characters:
+            console.print(f"  [dim]Shot characters: {list(shot_characters.keys())}[/dim]")
 
-        console.print(f"\n[bold]Layout {i + 1}/{num_shots}: {sname}[/bold]")
-        ok = generate_layout(shot["layout_prompt"], characters, layout_path)
+        if not make_keyframe(sname, anchor_kf_path):
+            return False
+        if os.path.exists(kf_path):
+            manifest.record(kf_path, kf_fp)
+        return True
+
+    video_engine = None
+
+    def clip_stage(sname, scheduler):
+        i = shot_index[sname]
+        clip_path = clip_paths[i]
+
+        if not os.path.exists(keyframe_paths[sname]):
+            # Without its input the clip can't be checked or rebuilt; keep one that already exists
+            if os.path.exists(clip_path) and os.path.getsize(clip_path) > 0:
+                console.print(f"  [dim]Clip {sname} kept (its keyframe is missing, so it can't be rebuilt).[/dim]")
+                return True
+            console.print(f"[red]No keyframe for {sname}, cannot generate its clip.[/red]")
+            return False
+
+        clip_fp = clip_fingerprint(shots[i], characters, video_engine_name, kling_params, keyframe_paths[sname])
+        if is_fresh(clip_path, clip_fp):
+            console.print(f"  [dim]Clip {sname} up to date, skipping.[/dim]")
+            return True
+        report_stale("Clip", sname, clip_path)
+
+        console.print(f"\n[bold]Clip {i + 1}/{num_shots}: {sname}[/bold]")
+        ok = video_engine.generate_video(
+            start_image_path=keyframe_paths[sname],
+            beats=shots[i]["beats"],
+            characters=characters,
+            output_path=clip_path,
+            kling_params=kling_params,
+        )
         if not ok:
-            console.print(f"[red]Layout generation failed for shot {i + 1}.[/red]")
-            if not auto_mode:
-                input("\nPress Enter to continue...")
+            console.print(f"[red]Video generation failed for {sname}.[/red]")
+        else:
+            manifest.record(clip_path, clip_fp)
+        return ok
+
+    stage_fns = {"layout": layout_stage, "keyframe": keyframe_stage, "clip": clip_stage}
+
+    def run_stages(stages, names=None):
+        """Run `stages` for `names` (default: every shot), `max_concurrent` shots at a time.
+
+        Returns failed shot names.
+        """
+        names = shot_names if names is None else names
+        nonlocal video_engine
+        if "clip" in stages and video_engine is None:
+            from directors_chair.video.engines.fal_kling_engine import FalKlingEngine
+            video_engine = FalKlingEngine(kling_params=kling_params)
+
+        def job(sname, scheduler):
+            for stage in stages:
+                if scheduler.cancelled:
+                    return False
+                # Journal fal requests so an interrupted run reattaches to them
+                scope = f"{sname}:{stage}"
+                with job_scope(job_journal, scope):
+                    ok = stage_fns[stage](sname, scheduler)
+                if ok:
+                    job_journal.clear(scope)
+                elif not scheduler.cancelled:
+                    job_journal.prune(scope)  # requests for inputs that have since changed
+                scheduler.mark(sname, stage, ok)
+                if not ok:
+                    return False
+            return True
+
+        # On Ctrl-C, release shots blocked on fal; their requests stay journaled for the next run
+        results = ShotScheduler(max_workers=max_concurrent).run(
+            names, job, on_cancel=lambda: get_job_runner().cancel_all("cancelled: run interrupted"))
+        return [sname for sname in names if not results[sname]]
+
+    if auto_mode:
+        # No review gates: stream every shot through all of its stages
+        stages = ["layout", "keyframe"] if keyframes_only else ["layout", "keyframe", "clip"]
+        console.print(Panel(
+            f"[bold]Shot Pipeline: {' → '.join(s.title() for s in stages)} "
+            f"({max_concurrent} shot(s) at a time)[/bold]",
+            border_style="cyan"
+        ))
+        layout_futures.update(start_layouts(layout_targets))
+        failed = run_stages(stages)
+        failed.sort(key=shot_index.get)
+        if failed:
+            console.print(f"[red]Failed shots: {', '.join(failed)}[/red]")
+        if keyframes_only:
+            console.print(f"\n[bold green]Keyframes only — stopping here.[/bold green]")
+            console.print(f"[yellow]  Layouts: {layouts_dir}/[/yellow]")
+            console.print(f"[yellow]  Keyframes: {keyframes_dir}/[/yellow]")
+            return
+        if failed:
             return
+    else:
+        # --- Phase 1: Layout Generation ---
+        console.print(Panel("[bold]Phase 1: Layout Generation[/bold]", border_style="cyan"))
 
-    # Layout review
-    if not auto_mode:
+        failed = build_layouts(layout_targets)
+        if failed:
+            console.print(f"[red]Layout generation failed for: {', '.join(failed)}[/red]")
+            input("\nPress Enter to continue...")
+            return
+
+        # Layout review
         console.print(Panel(
             f"[bold]Review layouts before keyframe generation.[/bold]\n\n"
             f"Layouts: {layouts_dir}/\n"
@@ -230,7 +543,7 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
                 "Layout Review:",
                 choices=[
                     "Accept all layouts - proceed to keyframes",
-                    "Re-generate a layout",
+                    "Re-generate layouts",
                     "Abort storyboard"
                 ]
             ).ask()
@@ -243,17 +556,20 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
             if review == "Accept all layouts - proceed to keyframes":
                 break
 
-            if review == "Re-generate a layout":
-                regen_choices = [sn for sn in shot_names]
-                pick = questionary.select("Which layout?", choices=regen_choices + ["Cancel"]).ask()
-                if pick and pick != "Cancel":
-                    idx = shot_names.index(pick)
+            if review == "Re-generate layouts":
+                picks = questionary.checkbox("Which layouts?", choices=list(shot_names)).ask()
+                if not picks:
+                    continue
+
+                unchanged = []
+                for pick in picks:
+                    idx = shot_index[pick]
                     layout_path = layout_paths[pick]
 
                     # Show current prompt and offer to edit
                     current_prompt = shots[idx].get("layout_prompt", "")
                     if current_prompt:
-                        console.print(f"\n[dim]Current prompt:[/dim]")
+                        console.print(f"\n[dim]{pick} — current prompt:[/dim]")
                         console.print(f"  {current_prompt}")
                         edited = questionary.text(
                             "Edit prompt (Enter to keep, or type new):",
@@ -268,6 +584,8 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
                                 with open(save_path, "w") as f:
                                     f.write(edited)
                                 console.print(f"  [yellow]Prompt saved to {prompt_file}[/yellow]")
+                        else:
+                            unchanged.append(pick)
 
                     if os.path.exists(layout_path):
                         os.remove(layout_path)
@@ -276,100 +594,31 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
                     if os.path.exists(script_path):
                         os.remove(script_path)
 
-                    console.print(f"Re-generating layout: {pick}...")
-                    ok = generate_layout(shots[idx]["layout_prompt"], characters, layout_path)
-                    if ok:
+                refresh = False
+                if unchanged:
+                    reuse = questionary.confirm(
+                        f"Prompt unchanged for {', '.join(unchanged)} — reuse the cached script?",
+                        default=True,
+                    ).ask()
+                    refresh = not reuse
+
+                console.print(f"Re-generating layouts: {', '.join(picks)}...")
+                failed = build_layouts(picks, refresh=refresh)
+                for pick in picks:
+                    if pick not in failed:
                         console.print(f"  [green]Layout {pick} re-generated.[/green]")
-    else:
-        console.print("[dim]Auto mode: accepting all layouts.[/dim]")
-
-    # --- Phase 2: Keyframe Generation ---
-    engine_label = "Kling O3 i2i" if keyframe_engine == "kling" else "Nano Banana Pro (Gemini)"
-    console.print(Panel(f"[bold]Phase 2: Keyframe Generation ({engine_label})[/bold]", border_style="cyan"))
-
-    from directors_chair.keyframe import generate_keyframe_kling, generate_keyframe_nano_banana, edit_keyframe
-
-    keyframe_paths = {}  # shot_name -> path
-    for i, shot in enumerate(shots):
-        sname = shot_names[i]
-        kf_path = os.path.join(keyframes_dir, f"keyframe_{sname}.png")
-        keyframe_paths[sname] = kf_path
-
-        # Skip shots not in target list (when targeting specific shots)
-        if target_names is not None and sname not in target_names:
-            continue
-
-        # If regen requested for this specific keyframe, or "all", delete existing first
-        if isinstance(regen_keyframes, list) and sname in target_names:
-            if os.path.exists(kf_path):
-                os.remove(kf_path)
-                console.print(f"  [yellow]Deleted keyframe_{sname}.png for regeneration.[/yellow]")
-        elif regen_keyframes == "all":
-            if os.path.exists(kf_path):
-                os.remove(kf_path)
-                console.print(f"  [yellow]Deleted keyframe_{sname}.png for regeneration.[/yellow]")
+                if failed:
+                    console.print(f"[red]Layout re-generation failed for: {', '.join(failed)}[/red]")
 
-        if os.path.exists(kf_path):
-            console.print(f"  [dim]Keyframe {sname} already exists, skipping.[/dim]")
-            continue
+        # --- Phase 2: Keyframe Generation ---
+        engine_label = "Kling O3 i2i" if keyframe_engine == "kling" else "Nano Banana Pro (Gemini)"
+        console.print(Panel(f"[bold]Phase 2: Keyframe Generation ({engine_label})[/bold]", border_style="cyan"))
 
-        console.print(f"\n[bold]Keyframe {i + 1}/{num_shots}: {sname}[/bold]")
-        # Per-shot character scoping: if shot has "characters" list, only use those
-        shot_characters = characters
-        if "characters" in shot and isinstance(shot["characters"], list):
-            shot_characters = {k: characters[k] for k in shot["characters"] if k in characters}
-            console.print(f"  [dim]Shot characters: {list(shot_characters.keys())}[/dim]")
+        failed = run_stages(["keyframe"])
+        if failed:
+            console.print(f"[red]Keyframe generation failed for: {', '.join(failed)} (continuing)[/red]")
 
-        # Determine composition reference and optional anchor keyframe
-        comp_path = layout_paths[sname]
-        anchor_kf_path = None
-        anchor_name = shot.get("anchor_keyframe")
-        if anchor_name and anchor_name in keyframe_paths:
-            anchor_kf = keyframe_paths[anchor_name]
-            if os.path.exists(anchor_kf):
-                anchor_kf_path = anchor_kf
-                console.print(f"  [dim]Anchor keyframe: {anchor_name} (scene/background reference)[/dim]")
-            else:
-                console.print(f"  [yellow]Anchor keyframe {anchor_name} not found on disk[/yellow]")
-
-        if keyframe_engine == "gemini":
-            ok = generate_keyframe_nano_banana(
-                prompt=shot.get("keyframe_prompt", ""),
-                comp_image_path=comp_path,
-                characters=shot_characters,
-                output_path=kf_path,
-                kling_params=kling_params,
-                anchor_keyframe_path=anchor_kf_path,
-            )
-        else:
-            ok = generate_keyframe_kling(
-                prompt=shot.get("keyframe_prompt"),
-                comp_image_path=comp_path,
-                characters=shot_characters,
-                output_path=kf_path,
-                kling_params=kling_params,
-                keyframe_passes=shot.get("keyframe_passes"),
-            )
-        if not ok:
-            console.print(f"[red]Keyframe generation failed for {sname}, continuing...[/red]")
-            continue
-
-        # Optional post-generation edit pass
-        edit_prompt = shot.get("keyframe_edit_prompt")
-        if edit_prompt and os.path.exists(kf_path):
-            console.print(f"  [cyan]Applying keyframe edit...[/cyan]")
-            edit_ok = edit_keyframe(
-                prompt=edit_prompt,
-                keyframe_path=kf_path,
-                output_path=kf_path,
-                kling_params=kling_params,
-                characters=shot_characters,
-            )
-            if not edit_ok:
-                console.print(f"  [yellow]Keyframe edit failed for {sname}, keeping original.[/yellow]")
-
-    # Keyframe review
-    if not auto_mode:
+        # Keyframe review
         console.print(Panel(
             f"[bold]Review keyframes before video generation.[/bold]\n\n"
             f"Keyframes: {keyframes_dir}/\n"
@@ -436,81 +685,45 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
                         os.remove(kf)
 
                     console.print(f"Re-generating keyframe: {pick} ({num_variants} variant(s))...")
-                    if keyframe_engine == "gemini":
-                        ok = generate_keyframe_nano_banana(
-                            prompt=shots[idx].get("keyframe_prompt", ""),
-                            comp_image_path=layout_paths[pick],
-                            characters=characters,
-                            output_path=kf,
-                            kling_params=kling_params,
-                            num_images=num_variants,
-                        )
-                    else:
-                        ok = generate_keyframe_kling(
-                            prompt=shots[idx].get("keyframe_prompt"),
-                            comp_image_path=layout_paths[pick],
-                            characters=characters,
-                            output_path=kf,
-                            kling_params=kling_params,
-                            keyframe_passes=shots[idx].get("keyframe_passes"),
-                        )
-                    if ok:
+                    anchor_kf_path = resolve_anchor(pick)
+                    if make_keyframe(pick, anchor_kf_path, num_images=num_variants):
                         console.print(f"  [green]Keyframe {pick} re-generated.[/green]")
-    else:
-        console.print("[dim]Auto mode: accepting all keyframes.[/dim]")
+                        if os.path.exists(kf):
+                            manifest.record(kf, keyframe_fp(pick, anchor_kf_path))
 
-    if keyframes_only:
-        console.print(f"\n[bold green]Keyframes only — stopping here.[/bold green]")
-        console.print(f"[yellow]  Layouts: {layouts_dir}/[/yellow]")
-        console.print(f"[yellow]  Keyframes: {keyframes_dir}/[/yellow]")
-        if not auto_mode:
+        if keyframes_only:
+            console.print(f"\n[bold green]Keyframes only — stopping here.[/bold green]")
+            console.print(f"[yellow]  Layouts: {layouts_dir}/[/yellow]")
+            console.print(f"[yellow]  Keyframes: {keyframes_dir}/[/yellow]")
             input("\nPress Enter to continue...")
-        return
-
-    # --- Phase 3: Video Generation ---
-    console.print(Panel("[bold]Phase 3: Video Generation (Kling O3 i2v)[/bold]", border_style="cyan"))
-
-    from directors_chair.video.engines.fal_kling_engine import FalKlingEngine
-
-    engine = FalKlingEngine(kling_params=kling_params)
-    clip_paths = []  # ordered list for stitching
-
-    for i, shot in enumerate(shots):
-        sname = shot_names[i]
-        clip_path = os.path.join(clips_dir, f"clip_{sname}.mp4")
-        clip_paths.append(clip_path)
+            return
 
-        if os.path.exists(clip_path) and os.path.getsize(clip_path) > 0:
-            console.print(f"  [dim]Clip {sname} already exists, skipping.[/dim]")
-            continue
+        # --- Phase 3: Video Generation ---
+        console.print(Panel("[bold]Phase 3: Video Generation (Kling O3 i2v)[/bold]", border_style="cyan"))
 
-        console.print(f"\n[bold]Clip {i + 1}/{num_shots}: {sname}[/bold]")
-        ok = engine.generate_video(
-            start_image_path=keyframe_paths[sname],
-            beats=shot["beats"],
-            characters=characters,
-            output_path=clip_path,
-            kling_params=kling_params,
-        )
-        if not ok:
-            console.print(f"[red]Video generation failed for {sname}.[/red]")
-            if not auto_mode:
-                input("\nPress Enter to continue...")
+        failed = run_stages(["clip"])
+        if failed:
+            console.print(f"[red]Video generation failed for: {', '.join(failed)}[/red]")
+            input("\nPress Enter to continue...")
             return
 
     # --- Phase 4: Stitch (if multiple shots) ---
-    if len(clip_paths) == 1:
-        final_path = os.path.join(output_base, f"{name}.mp4")
+    final_path = os.path.join(output_base, f"{name}.mp4")
+    from directors_chair.video.assembly import STITCH_VERSION
+    final_fp = fingerprint("final", STITCH_VERSION, [file_fingerprint(cp) for cp in clip_paths])
+    if manifest.is_fresh(final_path, final_fp, adopt=False):
+        console.print(f"\n[bold green]Final video up to date: {final_path}[/bold green]")
+    elif len(clip_paths) == 1:
         # Just copy the single clip
-        if not os.path.exists(final_path):
-            subprocess.check_call([
-                "ffmpeg", "-y", "-i", clip_paths[0], "-c", "copy", final_path
-            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        subprocess.check_call([
+            "ffmpeg", "-y", "-i", clip_paths[0], "-c", "copy", final_path
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        manifest.record(final_path, final_fp)
         console.print(f"\n[bold green]Final video: {final_path}[/bold green]")
     elif len(clip_paths) > 1:
         console.print(Panel("[bold]Phase 4: Stitching Clips[/bold]", border_style="cyan"))
-        final_path = os.path.join(output_base, f"{name}.mp4")
         _stitch_clips(clip_paths, final_path)
+        manifest.record(final_path, final_fp)
 
     console.print(f"\n[bold green]Done! All outputs in: {output_base}/[/bold green]")
     console.print(f"[yellow]  Layouts: {layouts_dir}/[/yellow]")
@@ -521,27 +734,7 @@ def storyboard_to_video(storyboard_file=None, auto_mode=False, keyframes_only=Fa
 
 
 def _stitch_clips(clip_paths, final_path):
-    """Stitch multiple clips into final video, re-encoding to common resolution."""
-    # Build ffmpeg filter to scale all inputs to 1280x720 and concatenate
-    inputs = []
-    filter_parts = []
-    for i, cp in enumerate(clip_paths):
-        inputs.extend(["-i", os.path.abspath(cp)])
-        filter_parts.append(f"[{i}:v]scale=1280:720:force_original_aspect_ratio=decrease,pad=1280:720:(ow-iw)/2:(oh-ih)/2,setsar=1[v{i}]")
-
-    stream_labels = "".join(f"[v{i}]" for i in range(len(clip_paths)))
-    filter_parts.append(f"{stream_labels}concat=n={len(clip_paths)}:v=1:a=0[out]")
-    filter_graph = ";".join(filter_parts)
-
-    cmd = [
-        "ffmpeg", "-y",
-        *inputs,
-        "-filter_complex", filter_graph,
-        "-map", "[out]",
-        "-c:v", "libx264", "-crf", "18", "-preset", "fast",
-        "-pix_fmt", "yuv420p",
-        final_path
-    ]
-
-    subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    """Stitch multiple clips into final video, re-encoding only clips that don't match."""
+    from directors_chair.video.assembly import concat_clips
+    concat_clips(clip_paths, final_path)
     console.print(f"\n[bold green]Final video: {final_path}[/bold green]")
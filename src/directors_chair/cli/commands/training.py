@@ -1,7 +1,7 @@
 import os
 import questionary
 from rich.panel import Panel
-from directors_chair.config.loader import load_config, save_config
+from directors_chair.config.loader import load_config, set_config_entry
 from directors_chair.training.manager import get_training_manager, TRAINING_ENGINES
 from directors_chair.cli.utils import console
 
@@ -184,7 +184,7 @@ def train_lora_command():
                 lora_entry["fal_url"] = manager.engine.last_lora_url
 
             config["loras"][lora_name] = lora_entry
-            save_config(config)
+            set_config_entry("loras", lora_name, lora_entry)
             console.print("[green]LoRA registered in config.json[/green]")
             input("\nPress Enter to continue...")
         else:
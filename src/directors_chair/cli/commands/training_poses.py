@@ -3,11 +3,10 @@ import io
 import random
 import json
 import questionary
-import requests
-import fal_client
 from PIL import Image
 from rich.table import Table
 from directors_chair.config.loader import load_config
+from directors_chair.fal import download_bytes, run_job, upload_file
 from directors_chair.cli.utils import console
 
 
@@ -145,7 +144,7 @@ def generate_training_poses():
 
     # 7. Upload hero image as reference
     console.print("\n[cyan]Uploading hero image to fal.ai...[/cyan]")
-    hero_url = fal_client.upload_file(hero_image)
+    hero_url = upload_file(hero_image)
 
     # 8. Generate each pose
     for i, pose in enumerate(expanded_poses):
@@ -157,9 +156,9 @@ def generate_training_poses():
         console.print(f"\n[bold]Pose {i + 1}/{len(expanded_poses)}:[/bold] {pose}")
 
         with console.status("[cyan]Generating...[/cyan]") as status:
-            handler = fal_client.submit(
+            result = run_job(
                 "fal-ai/instant-character",
-                arguments={
+                {
                     "prompt": full_prompt,
                     "image_url": hero_url,
                     "scale": identity_scale,
@@ -171,16 +170,9 @@ def generate_training_poses():
                     "output_format": "png",
                     "image_size": "square_hd",
                 },
+                on_log=lambda msg: status.update(f"[cyan]{msg}[/cyan]"),
             )
 
-            for event in handler.iter_events(with_logs=True):
-                if isinstance(event, fal_client.InProgress):
-                    if event.logs:
-                        for log in event.logs:
-                            status.update(f"[cyan]{log['message']}[/cyan]")
-
-            result = handler.get()
-
         images = result.get("images", [])
         if not images or not images[0].get("url"):
             console.print(f"  [red]Failed - no image in response[/red]")
@@ -190,9 +182,9 @@ def generate_training_poses():
 
         # Pass 2: Photorealism refinement via Kontext
         with console.status("[cyan]Refining for photorealism...[/cyan]") as status:
-            refine_handler = fal_client.submit(
+            refine_result = run_job(
                 "fal-ai/flux-pro/kontext",
-                arguments={
+                {
                     "prompt": (
                         "Make this image photorealistic. Render as a practical VFX creature "
                         "photographed on 35mm film with harsh natural sunlight, highly detailed "
@@ -205,16 +197,9 @@ def generate_training_poses():
                     "output_format": "png",
                     "safety_tolerance": "5",
                 },
+                on_log=lambda msg: status.update(f"[cyan]{msg}[/cyan]"),
             )
 
-            for event in refine_handler.iter_events(with_logs=True):
-                if isinstance(event, fal_client.InProgress):
-                    if event.logs:
-                        for log in event.logs:
-                            status.update(f"[cyan]{log['message']}[/cyan]")
-
-            refine_result = refine_handler.get()
-
         refined_images = refine_result.get("images", [])
         if not refined_images or not refined_images[0].get("url"):
             console.print(f"  [yellow]Refinement failed — saving unrefined pose[/yellow]")
@@ -223,9 +208,7 @@ def generate_training_poses():
             final_url = refined_images[0]["url"]
 
         # Download
-        response = requests.get(final_url)
-        response.raise_for_status()
-        img = Image.open(io.BytesIO(response.content))
+        img = Image.open(io.BytesIO(download_bytes(final_url)))
 
         # Save image
         img_path = os.path.join(output_dir, f"{char_choice}-{idx}.png")
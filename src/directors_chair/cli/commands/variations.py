@@ -1,12 +1,8 @@
 import os
-import io
-import random
 import json
 import questionary
-import requests
-import fal_client
-from PIL import Image
 from directors_chair.config.loader import load_config
+from directors_chair.fal import upload_file
 from directors_chair.cli.utils import console
 
 
@@ -90,7 +86,7 @@ def generate_variations():
 
     # 4. Upload reference image
     console.print("\n[cyan]Uploading reference image to fal.ai...[/cyan]")
-    image_url = fal_client.upload_file(source_path)
+    image_url = upload_file(source_path)
 
     # 5. Generate variations
     dataset_name = os.path.basename(output_dir)
@@ -98,44 +94,20 @@ def generate_variations():
     first_image_base = os.path.splitext(os.path.basename(source_path))[0]
     name_prefix = first_image_base.split("-")[0] if "-" in first_image_base else first_image_base
 
-    for i in range(count):
+    from directors_chair.generation.fal_engine import FalFluxGenerator
+    generator = FalFluxGenerator()
+    finished = 0
+    failed = []
+    for i, seed_params, img in generator.generate_many(
+        source_prompt, 28, count, image_url=image_url, strength=strength,
+    ):
         idx = existing_count + i
-        seed = random.randint(0, 2**32 - 1)
-
-        console.print(f"\n[bold]Variation {i + 1}/{count}[/bold] (seed: {seed})")
-
-        handler = fal_client.submit(
-            "fal-ai/flux/dev/image-to-image",
-            arguments={
-                "image_url": image_url,
-                "prompt": source_prompt,
-                "strength": strength,
-                "num_inference_steps": 28,
-                "guidance_scale": 3.5,
-                "seed": seed,
-                "enable_safety_checker": False,
-                "output_format": "png",
-            },
-        )
-
-        for event in handler.iter_events(with_logs=True):
-            if isinstance(event, fal_client.InProgress):
-                if event.logs:
-                    for log in event.logs:
-                        console.print(f"    [dim]{log['message']}[/dim]")
-
-        result = handler.get()
-
-        images = result.get("images", [])
-        if not images or not images[0].get("url"):
-            console.print(f"  [red]Failed - no image in response[/red]")
+        finished += 1
+        if isinstance(img, Exception):
+            console.print(f"  [red]Variation {i + 1} failed: {img}[/red]")
+            failed.append(i + 1)
             continue
 
-        # Download
-        response = requests.get(images[0]["url"])
-        response.raise_for_status()
-        img = Image.open(io.BytesIO(response.content))
-
         # Save image
         img_path = os.path.join(output_dir, f"{name_prefix}-{idx}.png")
         img.save(img_path)
@@ -147,7 +119,7 @@ def generate_variations():
         # Save metadata
         meta = {
             "prompt": source_prompt,
-            "seed": seed,
+            **seed_params,
             "strength": strength,
             "reference_image": source_choice,
             "generator": "fal-ai/flux/dev/image-to-image",
@@ -155,9 +127,12 @@ def generate_variations():
         with open(os.path.join(output_dir, f"{name_prefix}-{idx}.json"), "w") as f:
             json.dump(meta, f, indent=4)
 
-        console.print(f"  [green]Saved: {name_prefix}-{idx}.png[/green]")
+        console.print(f"  [green]Saved: {name_prefix}-{idx}.png ({finished}/{count} done)[/green]")
 
-    console.print(f"\n[bold green]Generated {count} variations![/bold green]")
+    saved = count - len(failed)
+    console.print(f"\n[bold green]Generated {saved} of {count} variations![/bold green]")
+    if failed:
+        console.print(f"[yellow]{len(failed)} variation(s) failed: {', '.join(map(str, sorted(failed)))}[/yellow]")
     console.print(f"Output: {output_dir}/")
     console.print(f"[yellow]Review and delete bad ones before training.[/yellow]")
     input("\nPress Enter to continue...")
@@ -4,7 +4,7 @@ import os
 import questionary
 from rich.table import Table
 from rich.panel import Panel
-from directors_chair.config.loader import load_config, save_config
+from directors_chair.config.loader import load_config, set_config_entry
 from directors_chair.cli.utils import console
 
 
@@ -85,15 +85,14 @@ def design_voice_command(char_name=None, description=None, sample_text=None, aut
         )
 
         # Save to config
-        if "voices" not in config:
-            config["voices"] = {}
-        config["voices"][char_name] = {
+        voice_entry = {
             "voice_id": voice_id,
             "name": f"{char_name}_voice",
             "description": description,
             "source": "designed",
         }
-        save_config(config)
+        config.setdefault("voices", {})[char_name] = voice_entry
+        set_config_entry("voices", char_name, voice_entry)
         console.print(f"[green]Voice '{char_name}' saved to config.[/green]")
 
         if not auto_mode:
@@ -142,15 +141,14 @@ def clone_voice_command(char_name=None, description=None, files_str=None, remove
         remove_background_noise=remove_noise,
     )
 
-    if "voices" not in config:
-        config["voices"] = {}
-    config["voices"][char_name] = {
+    voice_entry = {
         "voice_id": voice_id,
         "name": f"{char_name}_voice",
         "description": description,
         "source": "cloned",
     }
-    save_config(config)
+    config.setdefault("voices", {})[char_name] = voice_entry
+    set_config_entry("voices", char_name, voice_entry)
     console.print(f"[green]Voice '{char_name}' cloned and saved to config.[/green]")
 
     if not auto_mode:
@@ -247,16 +245,15 @@ def remix_voice_command(char_name=None, description=None, new_name=None, auto_mo
             description=description,
         )
 
-        if "voices" not in config:
-            config["voices"] = {}
-        config["voices"][new_name] = {
+        voice_entry = {
             "voice_id": saved_voice_id,
             "name": f"{new_name}_voice",
             "description": description,
             "source": "remixed",
             "remixed_from": char_name,
         }
-        save_config(config)
+        config.setdefault("voices", {})[new_name] = voice_entry
+        set_config_entry("voices", new_name, voice_entry)
         console.print(f"[green]Remixed voice '{new_name}' saved to config.[/green]")
 
         if not auto_mode:
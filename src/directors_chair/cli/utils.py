@@ -1,34 +1,111 @@
-import os
+import importlib.util
 import platform
-import psutil
+import sys
+import threading
+from typing import Any, Dict, Optional
 from rich.console import Console
 from rich.panel import Panel
 
-console = Console()
+
+class _QuietStatus:
+    """Stand-in for rich's Status when another spinner already owns the screen."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def update(self, *args, **kwargs):
+        pass
+
+
+class _ExclusiveStatus:
+    """Wraps a rich Status and releases the spinner lock when it exits."""
+
+    def __init__(self, status, lock):
+        self._status = status
+        self._lock = lock
+
+    def __enter__(self):
+        try:
+            return self._status.__enter__()
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            return self._status.__exit__(exc_type, exc, tb)
+        finally:
+            self._lock.release()
+
+
+class ChairConsole(Console):
+    """Console that tolerates concurrent ``status()`` spinners.
+
+    Rich allows a single live display at a time. When pipeline workers run
+    shots in parallel, the first caller gets the spinner and the others get
+    a quiet stand-in with the same ``update()`` API.
+    """
+
+    _status_lock = threading.Lock()
+
+    def status(self, *args, **kwargs):
+        if not self._status_lock.acquire(blocking=False):
+            return _QuietStatus()
+        return _ExclusiveStatus(super().status(*args, **kwargs), self._status_lock)
+
+
+console = ChairConsole()
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI clear via rich rather than spawning a `clear` shell
+    console.clear()
+
+def _accelerator_status() -> str:
+    """Describe the accelerator without importing torch just to draw the header."""
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        return "MPS Available" if torch.backends.mps.is_available() else "CPU Only"
+    if importlib.util.find_spec("torch") is None:
+        return "Torch Not Found"
+    if platform.system() == "Darwin" and platform.machine() == "arm64":
+        return "MPS Available"
+    return "CPU Only"
+
+
+_system_info: Optional[Dict[str, Any]] = None
+_system_info_lock = threading.Lock()
+
+
+def get_system_info() -> Dict[str, Any]:
+    """OS, processor, RAM and accelerator, probed once per process.
+
+    Returns:
+        Dict with os, processor, ram_gb and accelerator.
+    """
+    global _system_info
+    with _system_info_lock:
+        if _system_info is None:
+            import psutil
+            _system_info = {
+                "os": platform.system(),
+                "processor": platform.processor(),
+                "ram_gb": round(psutil.virtual_memory().total / (1024 ** 3), 1),
+                "accelerator": _accelerator_status(),
+            }
+        return _system_info
 
 def print_header():
     clear_screen()
-    
-    # System Info
-    ram_gb = round(psutil.virtual_memory().total / (1024 ** 3), 1)
-    system_os = platform.system()
-    processor = platform.processor()
-    
-    # Check for MPS
-    try:
-        import torch
-        mps_available = torch.backends.mps.is_available()
-        gpu_status = "MPS Available" if mps_available else "CPU Only"
-    except ImportError:
-        gpu_status = "Torch Not Found"
+
+    info = get_system_info()
 
     header_text = f"""
 [bold gold1]🎬 DIRECTOR'S CHAIR 🎬[/bold gold1]
 [italic]AI Image Generation & Training Kit[/italic]
 
-[cyan]System:[/cyan] {system_os} ({processor}) | [cyan]RAM:[/cyan] {ram_gb} GB | [cyan]Accelerator:[/cyan] {gpu_status}
+[cyan]System:[/cyan] {info["os"]} ({info["processor"]}) | [cyan]RAM:[/cyan] {info["ram_gb"]} GB | [cyan]Accelerator:[/cyan] {info["accelerator"]}
     """
     console.print(Panel(header_text.strip(), border_style="gold1"))
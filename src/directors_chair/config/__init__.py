@@ -1 +1 @@
-from .loader import load_config, get_prompt
+from .loader import load_config, save_config, update_config, set_config_entry, get_prompt
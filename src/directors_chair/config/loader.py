@@ -1,14 +1,119 @@
+import copy
 import json
 import os
-from typing import Dict, Any
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
 
-def load_config(config_path: str = "config/config.json") -> Dict[str, Any]:
-    with open(config_path, "r") as f:
-        return json.load(f)
+try:
+    import fcntl
+except ImportError:  # Windows: writes are still atomic, just not locked across processes
+    fcntl = None
+
+DEFAULT_CONFIG_PATH = "config/config.json"
+
+# abspath -> (mtime_ns, size, parsed document)
+_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+_cache_lock = threading.Lock()
+_write_lock = threading.RLock()
+
+
+def _read(path: str) -> Dict[str, Any]:
+    """Parsed config from the in-process cache, re-reading the file if it changed on disk."""
+    st = os.stat(path)
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+    with open(path, "r") as f:
+        data = json.load(f)
+    with _cache_lock:
+        _cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
+    """Current config as a private copy the caller may modify.
+
+    The parsed file is cached per process and only re-read when its mtime
+    or size changes, so calling this from hot paths is cheap.
+    """
+    return copy.deepcopy(_read(os.path.abspath(config_path)))
+
+
+class _FileLock:
+    """Advisory lock on ``<config>.lock`` so separate chair processes don't interleave writes."""
+
+    def __init__(self, path: str):
+        self.path = f"{path}.lock"
+        self._fd: Optional[int] = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self._fd = os.open(self.path, os.O_CREAT | os.O_RDWR, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        return False
+
+
+def _write(config: Dict[str, Any], path: str):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(config, f, indent=4)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    st = os.stat(path)
+    with _cache_lock:
+        _cache[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
+
+
+def save_config(config: Dict[str, Any], config_path: str = DEFAULT_CONFIG_PATH):
+    """Replace the whole config file atomically (temp file + rename, under a lock).
+
+    Prefer update_config when changing a few keys: it re-reads the file under
+    the lock, so concurrent writers don't overwrite each other's changes.
+    """
+    path = os.path.abspath(config_path)
+    with _write_lock, _FileLock(path):
+        _write(config, path)
+
+
+def update_config(mutator: Callable[[Dict[str, Any]], Any],
+                  config_path: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
+    """Apply `mutator` to the latest config on disk and save it, as one locked step.
+
+    Args:
+        mutator: Modifies the config dict in place.
+        config_path: Config file to update.
+
+    Returns:
+        A copy of the saved config.
+    """
+    path = os.path.abspath(config_path)
+    with _write_lock, _FileLock(path):
+        with _cache_lock:
+            _cache.pop(path, None)  # another process may have written within the same mtime tick
+        config = copy.deepcopy(_read(path))
+        mutator(config)
+        _write(config, path)
+    return copy.deepcopy(config)
+
+
+def set_config_entry(section: str, key: str, value: Any,
+                     config_path: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
+    """Set ``config[section][key] = value`` via update_config, creating the section if needed."""
+    def _set(config: Dict[str, Any]):
+        config.setdefault(section, {})[key] = value
+    return update_config(_set, config_path)
 
-def save_config(config: Dict[str, Any], config_path: str = "config/config.json"):
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=4)
 
 def get_prompt(prompt_input: str) -> str:
     if prompt_input.endswith(".txt") and os.path.exists(prompt_input):
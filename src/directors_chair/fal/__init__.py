@@ -0,0 +1,22 @@
+from .uploads import upload_file, upload_files, get_upload_cache, UploadCache
+from .jobs import FalJob, FalJobRunner, get_job_runner, submit_job, run_job
+from .journal import JobJournal, job_scope
+from .download import download_file, download_bytes
+from .session import get_session
+
+__all__ = [
+    "upload_file",
+    "upload_files",
+    "get_upload_cache",
+    "UploadCache",
+    "FalJob",
+    "FalJobRunner",
+    "get_job_runner",
+    "submit_job",
+    "run_job",
+    "JobJournal",
+    "job_scope",
+    "download_file",
+    "download_bytes",
+    "get_session",
+]
@@ -0,0 +1,286 @@
+import glob
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from .session import get_session
+
+CHUNK_SIZE = 1024 * 1024
+DEFAULT_RETRIES = 4
+SEGMENT_THRESHOLD = 32 * 1024 * 1024
+DEFAULT_SEGMENTS = 4
+
+ProgressCallback = Callable[[int], None]
+
+
+def _backoff(attempt: int):
+    time.sleep(min(2 ** attempt, 30))
+
+
+def _content_length(response: requests.Response) -> Optional[int]:
+    value = response.headers.get("content-length")
+    if value is None or "content-encoding" in response.headers:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _fetch_range(
+    url: str,
+    part_path: str,
+    start: int,
+    end: Optional[int],
+    retries: int,
+    on_chunk: Optional[ProgressCallback],
+    expected: Optional[int] = None,
+    if_range: Optional[str] = None,
+) -> int:
+    """Fetch bytes [start, end] of `url` into `part_path`, resuming from what's already there.
+
+    `end` is inclusive; None means to the end of the file, in which case
+    `expected` (if known) is the size to wait for. `if_range` (an ETag or
+    Last-Modified value) is sent with range requests so a changed file
+    comes back whole instead of being spliced onto the old bytes. Returns
+    the number of bytes in `part_path`. Raises RuntimeError once retries
+    run out.
+    """
+    if end is not None:
+        expected = end - start + 1
+    last_error: Optional[Exception] = None
+
+    for attempt in range(retries + 1):
+        have = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if expected is not None and have >= expected:
+            return have
+
+        headers = {}
+        if start + have > 0 or end is not None:
+            headers["Range"] = f"bytes={start + have}-{'' if end is None else end}"
+            if if_range:
+                headers["If-Range"] = if_range
+
+        try:
+            with get_session().get(url, headers=headers, stream=True) as response:
+                if response.status_code == 416 and expected is None and have > 0:
+                    return have  # nothing left to fetch
+                response.raise_for_status()
+                if headers.get("Range") and response.status_code != 206:
+                    if start > 0 or end is not None:
+                        raise RuntimeError("server ignored the Range header")
+                    have = 0  # full body instead of a resume; start over
+                with open(part_path, "ab" if have else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            if on_chunk:
+                                on_chunk(len(chunk))
+            have = os.path.getsize(part_path)
+            if expected is None or have >= expected:
+                return have
+            last_error = RuntimeError(f"got {have} of {expected} bytes")
+        except (requests.RequestException, OSError) as e:
+            last_error = e
+        if attempt < retries:
+            _backoff(attempt)
+
+    raise RuntimeError(f"Download failed after {retries + 1} attempts: {last_error}")
+
+
+def _probe(url: str) -> Tuple[Optional[int], bool, Dict[str, Any]]:
+    """(content length, accepts byte ranges, identity) for `url`.
+
+    The identity records the URL, ETag, Last-Modified and length, and is
+    what a part file must match to be resumed. Length and ranges are
+    (None, False) if the server can't be asked.
+    """
+    identity: Dict[str, Any] = {"url": url, "etag": None, "last_modified": None, "content_length": None}
+    try:
+        response = get_session().head(url, allow_redirects=True)
+        if response.ok:
+            ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+            total = _content_length(response)
+            identity.update(
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                content_length=total,
+            )
+            return total, ranges, identity
+    except requests.RequestException:
+        pass
+    return None, False, identity
+
+
+def _if_range(identity: Dict[str, Any]) -> Optional[str]:
+    """Validator for an If-Range header: a strong ETag, else Last-Modified."""
+    etag = identity.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return identity.get("last_modified")
+
+
+def _read_identity(meta_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(meta_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_identity(meta_path: str, identity: Dict[str, Any]):
+    tmp_path = f"{meta_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(identity, f)
+    os.replace(tmp_path, meta_path)
+
+
+def _segments(total: int, count: int) -> List[Tuple[int, int]]:
+    size = -(-total // count)
+    return [(start, min(start + size, total) - 1) for start in range(0, total, size)]
+
+
+def download_file(
+    url: str,
+    output_path: str,
+    retries: int = DEFAULT_RETRIES,
+    segments: int = DEFAULT_SEGMENTS,
+    progress_desc: Optional[str] = None,
+) -> int:
+    """Download `url` to `output_path` atomically. Returns the file size.
+
+    Data streams in 1 MB chunks into ``<output_path>.part``; a dropped
+    connection resumes with an HTTP Range request instead of starting
+    over. The part file is kept if the process is interrupted, so calling
+    again for the same output picks up where the last attempt stopped.
+    ``<output_path>.part.json`` records the URL, ETag, Last-Modified and
+    length the part was fetched from; a part is only resumed when they
+    still match, and resumes send If-Range, so bytes from a different or
+    changed file are never spliced together (the download starts over
+    instead, as it does when the server ignores the range). Files over 32 MB on
+    servers that accept ranges are fetched as `segments` parallel ranges,
+    whose pieces are likewise kept until they are joined. The part file
+    only replaces `output_path` once its size matches the server's
+    Content-Length, so an interrupted download never leaves a truncated
+    file behind.
+
+    Args:
+        url: Source URL.
+        output_path: Destination file.
+        retries: Attempts per range after the first.
+        segments: Parallel ranges for large files (1 disables).
+        progress_desc: Show a tqdm progress bar with this label.
+
+    Raises:
+        RuntimeError: If the download can't be completed or is short.
+    """
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    part_path = f"{output_path}.part"
+    meta_path = f"{part_path}.json"
+
+    total, accepts_ranges, identity = _probe(url)
+    if_range = _if_range(identity)
+
+    leftovers = [part_path] + glob.glob(glob.escape(part_path) + "[0-9]*")
+    if _read_identity(meta_path) != identity:
+        # Left over from a different URL or an older version of the file
+        _remove_all(leftovers)
+    _write_identity(meta_path, identity)
+
+    have = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    if total is not None and have > total:
+        os.remove(part_path)
+        have = 0
+    # A partial single-stream download is resumed as a single stream
+    parallel = (
+        have == 0 and segments > 1 and accepts_ranges
+        and total is not None and total >= SEGMENT_THRESHOLD
+    )
+
+    segment_paths: List[str] = []
+    if parallel:
+        ranges = _segments(total, segments)
+        segment_paths = [f"{part_path}{i}" for i in range(len(ranges))]
+
+    bar = None
+    on_chunk = None
+    if progress_desc:
+        from tqdm import tqdm
+        resumed = have + sum(os.path.getsize(p) for p in segment_paths if os.path.exists(p))
+        bar = tqdm(desc=progress_desc, total=total, initial=resumed, unit="iB", unit_scale=True, unit_divisor=1024)
+        on_chunk = bar.update
+
+    try:
+        if parallel:
+            try:
+                with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                    futures = [
+                        pool.submit(_fetch_range, url, seg_path, start, end, retries, on_chunk, None, if_range)
+                        for seg_path, (start, end) in zip(segment_paths, ranges)
+                    ]
+                    for future in futures:
+                        future.result()
+                with open(part_path, "wb") as out:
+                    for seg_path in segment_paths:
+                        with open(seg_path, "rb") as seg:
+                            while True:
+                                block = seg.read(CHUNK_SIZE)
+                                if not block:
+                                    break
+                                out.write(block)
+                _remove_all(segment_paths)
+            except RuntimeError:
+                # Ranges turned out to be unreliable; fall back to one stream
+                parallel = False
+                _remove_all(segment_paths + [part_path])
+                if bar is not None:
+                    bar.reset()
+
+        if not parallel:
+            _fetch_range(url, part_path, 0, None, retries, on_chunk, expected=total, if_range=if_range)
+
+        size = os.path.getsize(part_path)
+        if (total is not None and size != total) or size == 0:
+            _remove_all([part_path, meta_path])  # not resumable: wrong size or empty
+            if size == 0:
+                raise RuntimeError(f"Download returned an empty file: {url}")
+            raise RuntimeError(f"Download incomplete: got {size} of {total} bytes from {url}")
+        os.replace(part_path, output_path)
+        _remove_all([meta_path])
+        return size
+    finally:
+        if bar is not None:
+            bar.close()
+
+
+def _remove_all(paths: List[str]):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def download_bytes(url: str, retries: int = DEFAULT_RETRIES) -> bytes:
+    """Fetch a small file (e.g. a generated image) into memory, with retries.
+
+    Raises:
+        RuntimeError: If every attempt fails or the body is short.
+    """
+    last_error: Optional[Exception] = None
+    for attempt in range(retries + 1):
+        try:
+            response = get_session().get(url)
+            response.raise_for_status()
+            expected = _content_length(response)
+            if expected is None or len(response.content) == expected:
+                return response.content
+            last_error = RuntimeError(f"got {len(response.content)} of {expected} bytes")
+        except requests.RequestException as e:
+            last_error = e
+        if attempt < retries:
+            _backoff(attempt)
+    raise RuntimeError(f"Download failed after {retries + 1} attempts: {last_error}")
@@ -0,0 +1,205 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+import fal_client
+
+from .journal import arguments_hash, current_job_scope
+
+DEFAULT_POLL_INTERVAL = 2.0
+MAX_STATUS_FAILURES = 5
+
+LogCallback = Callable[[str], None]
+
+
+def log_message(log) -> str:
+    """Text of a fal log entry (dicts with 'message', or anything printable)."""
+    return log.get("message", "") if isinstance(log, dict) else str(log)
+
+
+class FalJob:
+    """One submitted fal request. ``future`` resolves to the result dict."""
+
+    def __init__(self, app: str, request_id: str, on_log: Optional[LogCallback] = None):
+        self.app = app
+        self.request_id = request_id
+        self.on_log = on_log
+        self.state = "queued"
+        self.future: Future = Future()
+        self._logs_seen = 0
+        self._status_failures = 0
+
+    def result(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Block until the job finishes. Re-raises the job's error."""
+        return self.future.result(timeout)
+
+    def done(self) -> bool:
+        return self.future.done()
+
+
+class FalJobRunner:
+    """Keeps many fal requests in flight and watches them from one thread.
+
+    ``submit()`` queues a request and returns a FalJob immediately; a single
+    poller thread checks every pending request's status each interval,
+    forwards new log lines to the job's ``on_log`` callback and resolves
+    the job's future with the result (or the error fal raised). Callers
+    that want the old blocking behaviour use ``run()``.
+    """
+
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._jobs: Dict[str, FalJob] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, app: str, arguments: Dict[str, Any], on_log: Optional[LogCallback] = None) -> FalJob:
+        """Submit a request to `app` and start tracking it."""
+        handler = fal_client.submit(app, arguments=arguments)
+        return self.attach(app, handler.request_id, on_log)
+
+    def attach(self, app: str, request_id: str, on_log: Optional[LogCallback] = None) -> FalJob:
+        """Track an already-submitted request by id."""
+        job = FalJob(app, request_id, on_log)
+        with self._cond:
+            self._jobs[request_id] = job
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._poll_loop, name="fal-jobs", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        return job
+
+    def run(self, app: str, arguments: Dict[str, Any], on_log: Optional[LogCallback] = None) -> Dict[str, Any]:
+        """Submit and wait for the result (drop-in for submit + iter_events + get)."""
+        return self.submit(app, arguments, on_log).result()
+
+    def cancel_all(self, reason: str = "cancelled"):
+        """Stop waiting on every tracked request.
+
+        Their futures fail with RuntimeError so blocked callers return. The
+        requests themselves keep running on fal; a journaled request is left
+        in the journal so the next run reattaches to it.
+        """
+        with self._cond:
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+        for job in jobs:
+            job.state = "cancelled"
+            if not job.future.done():
+                job.future.set_exception(RuntimeError(f"fal request {job.request_id} {reason}"))
+
+    def in_flight(self) -> int:
+        with self._cond:
+            return len(self._jobs)
+
+    def _poll_loop(self):
+        while True:
+            with self._cond:
+                while not self._jobs:
+                    self._cond.wait()
+                jobs = list(self._jobs.values())
+
+            for job in jobs:
+                self._poll(job)
+
+            with self._cond:
+                self._cond.wait(self.poll_interval)
+
+    def _poll(self, job: FalJob):
+        try:
+            status = fal_client.status(job.app, job.request_id, with_logs=True)
+        except Exception as e:
+            job._status_failures += 1
+            if job._status_failures >= MAX_STATUS_FAILURES:
+                self._finish(job, error=e)
+            return
+        job._status_failures = 0
+
+        self._deliver_logs(job, getattr(status, "logs", None) or [])
+
+        if isinstance(status, fal_client.Completed):
+            try:
+                result = fal_client.result(job.app, job.request_id)
+            except Exception as e:
+                self._finish(job, error=e)
+            else:
+                self._finish(job, result=result)
+        elif isinstance(status, fal_client.InProgress):
+            job.state = "running"
+
+    def _deliver_logs(self, job: FalJob, logs):
+        # Status responses carry the full log so far; only forward new lines.
+        if len(logs) < job._logs_seen:
+            job._logs_seen = 0
+        new_logs = logs[job._logs_seen:]
+        job._logs_seen = len(logs)
+        if not job.on_log:
+            return
+        for log in new_logs:
+            try:
+                job.on_log(log_message(log))
+            except Exception:
+                pass
+
+    def _finish(self, job: FalJob, result: Optional[Dict[str, Any]] = None, error: Optional[BaseException] = None):
+        with self._cond:
+            if self._jobs.pop(job.request_id, None) is None:
+                return  # cancelled while this poll was in flight
+        if error is not None:
+            job.state = "failed"
+            job.future.set_exception(error)
+        else:
+            job.state = "completed"
+            job.future.set_result(result)
+
+
+_runner: Optional[FalJobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> FalJobRunner:
+    """Process-wide fal job runner."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = FalJobRunner()
+        return _runner
+
+
+def submit_job(app: str, arguments: Dict[str, Any], on_log: Optional[LogCallback] = None) -> FalJob:
+    """Submit a fal request on the shared runner without waiting for it."""
+    return get_job_runner().submit(app, arguments, on_log)
+
+
+def run_job(app: str, arguments: Dict[str, Any], on_log: Optional[LogCallback] = None) -> Dict[str, Any]:
+    """Submit a fal request on the shared runner and wait for its result.
+
+    Inside a ``job_scope``, the request id is journaled before waiting; if
+    the journal already holds a request for the same endpoint and
+    arguments (an interrupted earlier run), that request is reattached
+    instead of paying for a new one.
+    """
+    runner = get_job_runner()
+    journal, scope = current_job_scope()
+    if journal is None:
+        return runner.run(app, arguments, on_log)
+
+    args_hash = arguments_hash(app, arguments)
+    entry = journal.lookup(scope, args_hash)
+    if entry:
+        from directors_chair.cli.utils import console
+        console.print(f"  [cyan]{scope}: reattaching to fal request {entry['request_id']}[/cyan]")
+        try:
+            return runner.attach(app, entry["request_id"], on_log).result()
+        except Exception as e:
+            console.print(f"  [yellow]{scope}: earlier request could not be recovered ({e}), resubmitting[/yellow]")
+            journal.discard(scope, args_hash)
+
+    job = runner.submit(app, arguments, on_log)
+    journal.record(scope, args_hash, app, job.request_id)
+    try:
+        return job.result()
+    except Exception:
+        if job.state != "cancelled":  # keep cancelled requests for the next run to reattach
+            journal.discard(scope, args_hash)
+        raise
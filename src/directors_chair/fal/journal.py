@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from directors_chair.hashing import text_sha256
+
+
+def arguments_hash(app: str, arguments: Dict[str, Any]) -> str:
+    return text_sha256(app, json.dumps(arguments, sort_keys=True, default=str))
+
+
+class JobJournal:
+    """On-disk record of submitted fal requests, so paid jobs survive a restart.
+
+    Entries are grouped by scope (``"<shot>:<stage>"``) and keyed by a hash
+    of the endpoint and arguments, so a stage that submits several requests
+    (multi-pass keyframes, generate + edit) can reattach to each of them.
+    A scope is cleared once its stage has finished and saved its output;
+    after a failed attempt, ``prune`` drops the entries that attempt no
+    longer asked for (its inputs changed), so they aren't kept forever.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._scopes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._used: Dict[str, Set[str]] = {}  # scope -> hashes looked up or recorded this run
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self._scopes = json.load(f)
+            except (OSError, ValueError):
+                self._scopes = {}
+
+    def _write(self):
+        if not self._scopes:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._scopes, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def lookup(self, scope: str, args_hash: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._used.setdefault(scope, set()).add(args_hash)
+            return self._scopes.get(scope, {}).get(args_hash)
+
+    def record(self, scope: str, args_hash: str, app: str, request_id: str):
+        with self._lock:
+            self._used.setdefault(scope, set()).add(args_hash)
+            self._scopes.setdefault(scope, {})[args_hash] = {
+                "app": app,
+                "request_id": request_id,
+                "submitted_at": time.time(),
+            }
+            self._write()
+
+    def discard(self, scope: str, args_hash: str):
+        with self._lock:
+            entries = self._scopes.get(scope)
+            if entries is None or entries.pop(args_hash, None) is None:
+                return
+            if not entries:
+                del self._scopes[scope]
+            self._write()
+
+    def clear(self, scope: str):
+        with self._lock:
+            self._used.pop(scope, None)
+            if self._scopes.pop(scope, None) is not None:
+                self._write()
+
+    def prune(self, scope: str):
+        """Drop `scope`'s entries whose arguments weren't requested in this run.
+
+        A scope that made no requests this run (it failed before reaching
+        fal) is left alone, since nothing says its entries are stale.
+        """
+        with self._lock:
+            entries = self._scopes.get(scope)
+            used = self._used.get(scope)
+            if not entries or used is None:
+                return
+            stale = [h for h in entries if h not in used]
+            if not stale:
+                return
+            for h in stale:
+                del entries[h]
+            if not entries:
+                del self._scopes[scope]
+            self._write()
+
+    def retain_scopes(self, scopes: Iterable[str]):
+        """Drop every scope not in `scopes` (e.g. shots removed from the storyboard)."""
+        keep = set(scopes)
+        with self._lock:
+            stale = [scope for scope in self._scopes if scope not in keep]
+            if not stale:
+                return
+            for scope in stale:
+                del self._scopes[scope]
+            self._write()
+
+    def pending(self) -> Dict[str, int]:
+        """{scope: number of recorded requests}"""
+        with self._lock:
+            return {scope: len(entries) for scope, entries in self._scopes.items()}
+
+
+_local = threading.local()
+
+
+@contextmanager
+def job_scope(journal: Optional[JobJournal], scope: str):
+    """Journal every fal request run on this thread under `scope`."""
+    previous = getattr(_local, "scope", None)
+    _local.scope = (journal, scope) if journal is not None else None
+    try:
+        yield
+    finally:
+        _local.scope = previous
+
+
+def current_job_scope() -> Tuple[Optional[JobJournal], Optional[str]]:
+    return getattr(_local, "scope", None) or (None, None)
@@ -0,0 +1,125 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import fal_client
+
+from directors_chair.hashing import file_sha256
+
+DEFAULT_UPLOAD_TTL_HOURS = 24
+DEFAULT_UPLOAD_WORKERS = 4
+
+
+class UploadCache:
+    """Persistent map of file content hash -> fal storage URL.
+
+    Entries expire after `ttl_seconds` because fal storage URLs are not
+    permanent. The JSON file is re-read and merged on every write so
+    several CLI processes can share it.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._read()
+
+    def _read(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        return {k: v for k, v in entries.items() if v.get("expires_at", 0) > now}
+
+    def _write(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._entries, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self, digest: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(digest)
+        if entry and entry.get("expires_at", 0) > time.time():
+            return entry["url"]
+        return None
+
+    def put(self, digest: str, url: str, source_path: str = ""):
+        now = time.time()
+        with self._lock:
+            self._entries = {**self._read(), **self._entries}
+            self._entries[digest] = {
+                "url": url,
+                "source": source_path,
+                "uploaded_at": now,
+                "expires_at": now + self.ttl_seconds,
+            }
+            self._write()
+
+
+_cache: Optional[UploadCache] = None
+_cache_lock = threading.Lock()
+_inflight: Dict[str, threading.Lock] = {}
+
+
+def get_upload_cache() -> UploadCache:
+    """Process-wide upload cache, stored under the generated-assets directory."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            from directors_chair.config.loader import load_config
+            config = load_config()
+            output_dir = config.get("directories", {}).get("output", "assets/generated")
+            ttl_hours = config.get("system", {}).get("upload_cache_ttl_hours", DEFAULT_UPLOAD_TTL_HOURS)
+            _cache = UploadCache(
+                os.path.join(output_dir, "cache", "fal_uploads.json"),
+                ttl_seconds=float(ttl_hours) * 3600,
+            )
+        return _cache
+
+
+def upload_file(path: str) -> str:
+    """Upload a local file to fal storage, reusing a cached URL for identical content.
+
+    Drop-in replacement for ``fal_client.upload_file``. Concurrent callers
+    uploading the same content wait for a single upload.
+    """
+    cache = get_upload_cache()
+    digest = file_sha256(path)
+
+    url = cache.get(digest)
+    if url:
+        return url
+
+    with _cache_lock:
+        lock = _inflight.setdefault(digest, threading.Lock())
+    with lock:
+        url = cache.get(digest)
+        if url:
+            return url
+        url = fal_client.upload_file(path)
+        cache.put(digest, url, source_path=path)
+        return url
+
+
+def upload_files(paths: List[str], max_workers: int = DEFAULT_UPLOAD_WORKERS) -> List[str]:
+    """Upload several files concurrently and return their URLs in input order.
+
+    Setup time for a request with many reference images is bounded by the
+    slowest upload rather than the sum. The first failure is re-raised.
+    """
+    if not paths:
+        return []
+    if len(paths) == 1:
+        return [upload_file(paths[0])]
+    workers = max(1, min(max_workers, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fal-upload") as pool:
+        return list(pool.map(upload_file, paths))
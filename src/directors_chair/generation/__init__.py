@@ -1,5 +1,14 @@
 from .factory import get_generator
 from .engine import BaseGenerator, ZImageTurboGenerator, FluxSchnellGenerator
-from .fal_engine import FalFluxGenerator
+from .lora_registry import LoraRegistry, get_lora_registry
 
-__all__ = ["get_generator", "BaseGenerator", "ZImageTurboGenerator", "FluxSchnellGenerator", "FalFluxGenerator"]
+
+def __getattr__(name):
+    # fal_engine pulls in fal_client and PIL; load it only when asked for
+    if name == "FalFluxGenerator":
+        from .fal_engine import FalFluxGenerator
+        return FalFluxGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ["get_generator", "BaseGenerator", "ZImageTurboGenerator", "FluxSchnellGenerator", "FalFluxGenerator",
+           "LoraRegistry", "get_lora_registry"]
@@ -1,17 +1,63 @@
+import random
 from abc import ABC, abstractmethod
-from mflux.models.z_image import ZImageTurbo
-from mflux.models.flux.variants.txt2img.flux import Flux1
-from mflux.models.common.resolution.path_resolution import PathResolution
-from mflux.models.z_image.weights.z_image_weight_definition import ZImageWeightDefinition
-from mflux.models.common.config.model_config import ModelConfig
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 class BaseGenerator(ABC):
     @abstractmethod
     def generate(self, prompt: str, steps: int, seed: int):
         pass
 
+    def generate_batch(self, prompt: str, steps: int, seed: int, count: int = 1) -> List[Any]:
+        """Generate `count` images; image k uses seed ``seed + k``.
+
+        Local models make one image per request, so this is also what
+        generate_many runs for each of its requests.
+        """
+        return [self.generate(prompt=prompt, steps=steps, seed=seed + k) for k in range(count)]
+
+    def generate_many(self, prompt: str, steps: int, count: int,
+                      max_concurrent: Optional[int] = None) -> Iterator[Tuple[int, Dict[str, Any], Any]]:
+        """Generate `count` images, yielding (index, params, image) as each finishes.
+
+        `params` holds what reproduces the image: its seed, plus batch size
+        and position when it came from a multi-image request. A failed
+        image yields its exception in place of the image so the rest of
+        the run carries on. Local models run one image at a time;
+        `max_concurrent` only matters for cloud generators.
+        """
+        for start, seed, n in self._plan_batches(count, 1):
+            try:
+                image = self.generate_batch(prompt, steps, seed, n)[0]
+            except Exception as e:
+                image = e
+            yield start, self._batch_params(seed, n, 0), image
+
+    @staticmethod
+    def _plan_batches(count: int, per_request: int) -> List[Tuple[int, int, int]]:
+        """Split `count` images into (first index, seed, size) requests.
+
+        Seeded the way generate_batch seeds its requests: one random base
+        seed, request k using ``seed + k``.
+        """
+        seed = random.randint(0, 2**32 - 1)
+        return [
+            (start, (seed + k) % 2**32, min(per_request, count - start))
+            for k, start in enumerate(range(0, count, per_request))
+        ]
+
+    @staticmethod
+    def _batch_params(seed: int, num_images: int, batch_index: int) -> Dict[str, Any]:
+        if num_images == 1:
+            return {"seed": seed}
+        return {"seed": seed, "num_images": num_images, "batch_index": batch_index}
+
 class ZImageTurboGenerator(BaseGenerator):
     def __init__(self, local_model_path: str = None, lora_paths: list[str] = None):
+        from mflux.models.z_image import ZImageTurbo
+        from mflux.models.common.resolution.path_resolution import PathResolution
+        from mflux.models.z_image.weights.z_image_weight_definition import ZImageWeightDefinition
+        from mflux.models.common.config.model_config import ModelConfig
+
         if local_model_path:
              model_path = local_model_path
         else:
@@ -33,6 +79,9 @@ class ZImageTurboGenerator(BaseGenerator):
 
 class FluxSchnellGenerator(BaseGenerator):
     def __init__(self, local_model_path: str = None, lora_paths: list[str] = None):
+        from mflux.models.flux.variants.txt2img.flux import Flux1
+        from mflux.models.common.config.model_config import ModelConfig
+
         model_path = local_model_path or ModelConfig.schnell().model_name
         self.model = Flux1(
             quantize=4,
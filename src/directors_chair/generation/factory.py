@@ -2,40 +2,40 @@ from typing import Dict, Optional
 import os
 from directors_chair.config.loader import load_config
 from .engine import BaseGenerator, ZImageTurboGenerator, FluxSchnellGenerator
-from .fal_engine import FalFluxGenerator
+from .residency import DEFAULT_MODEL_BYTES, ESTIMATED_MODEL_BYTES, get_model_residency
 
 class GeneratorFactory:
+    # Cloud generators are cheap to keep; local models go through the residency manager
     _instances: Dict[str, BaseGenerator] = {}
 
     @classmethod
     def get_generator(cls, token: str, lora_paths: list[str] = None) -> BaseGenerator:
         token = token.lower()
 
-        cache_key = token
-        if lora_paths:
-            cache_key = f"{token}|{str(sorted(lora_paths))}"
-
-        if cache_key in cls._instances:
+        if token.startswith("fal-"):
+            # fal.ai cloud generators
+            cache_key = token
+            if lora_paths:
+                cache_key = f"{token}|{str(sorted(lora_paths))}"
+            if cache_key not in cls._instances:
+                from .fal_engine import FalFluxGenerator
+                cls._instances[cache_key] = FalFluxGenerator(lora_paths=lora_paths)
             return cls._instances[cache_key]
 
         config = load_config()
-        generator: Optional[BaseGenerator] = None
+        model_path = cls._resolve_local_model(token, config)
 
-        if token.startswith("fal-"):
-            # fal.ai cloud generators
-            generator = FalFluxGenerator(lora_paths=lora_paths)
-        elif "schnell" in token:
-            model_path = cls._resolve_local_model(token, config)
-            generator = FluxSchnellGenerator(local_model_path=model_path, lora_paths=lora_paths)
-        elif "z-image" in token or "zimage" in token:
-            model_path = cls._resolve_local_model(token, config)
-            generator = ZImageTurboGenerator(local_model_path=model_path, lora_paths=lora_paths)
+        if "schnell" in token:
+            family = "flux-schnell"
+            loader = lambda: FluxSchnellGenerator(local_model_path=model_path, lora_paths=lora_paths)
         else:
-            model_path = cls._resolve_local_model(token, config)
-            generator = ZImageTurboGenerator(local_model_path=model_path, lora_paths=lora_paths)
+            family = "zimage-turbo"
+            loader = lambda: ZImageTurboGenerator(local_model_path=model_path, lora_paths=lora_paths)
 
-        cls._instances[cache_key] = generator
-        return generator
+        return get_model_residency().get(
+            token, lora_paths, loader,
+            size_bytes=ESTIMATED_MODEL_BYTES.get(family, DEFAULT_MODEL_BYTES),
+        )
 
     @classmethod
     def _resolve_local_model(cls, token: str, config: dict) -> Optional[str]:
@@ -1,10 +1,13 @@
 import io
-import requests
-import fal_client
-from typing import Optional, List, Dict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from PIL import Image
+from directors_chair.fal import download_bytes, run_job
 from .engine import BaseGenerator
 
+DEFAULT_MAX_CONCURRENT_IMAGES = 4
+MAX_IMAGES_PER_REQUEST = 4  # num_images limit on the flux endpoints
+
 
 class FalFluxGenerator(BaseGenerator):
     def __init__(self, local_model_path: str = None, lora_paths: list[str] = None,
@@ -19,34 +22,93 @@ class FalFluxGenerator(BaseGenerator):
         self._lora_paths = lora_paths or []
 
     def _resolve_lora_urls(self) -> List[Dict]:
-        """Resolve local LoRA paths to fal URLs via config, or use direct URLs."""
+        """Resolve local LoRA paths to fal URLs via the LoRA registry, or use direct URLs.
+
+        Not memoized here: this generator lives for the whole process, and the
+        registry already re-indexes when config.json changes, so a retrained
+        or re-uploaded LoRA is picked up on the next request.
+        """
         if self.lora_urls:
             return self.lora_urls
 
         if not self._lora_paths:
             return []
 
-        from directors_chair.config.loader import load_config
-        config = load_config()
-        config_loras = config.get("loras", {})
-
-        resolved = []
-        for path in self._lora_paths:
-            # Find matching config entry by path
-            for name, entry in config_loras.items():
-                if entry.get("path") == path and entry.get("fal_url"):
-                    resolved.append({"path": entry["fal_url"], "scale": 1.0})
-                    break
-            else:
-                # If no fal_url found, try uploading the local file
-                from directors_chair.cli.utils import console
-                console.print(f"  [yellow]No fal URL for {path}, uploading...[/yellow]")
-                url = fal_client.upload_file(path)
-                resolved.append({"path": url, "scale": 1.0})
-
-        return resolved
+        from .lora_registry import get_lora_registry
+        registry = get_lora_registry()
+        return [{"path": registry.resolve(path), "scale": 1.0} for path in self._lora_paths]
 
     def generate(self, prompt: str, steps: int, seed: int):
+        return self._request(prompt, steps, seed, 1, verbose=True)[0]
+
+    def generate_batch(self, prompt: str, steps: int, seed: int, count: int = 1,
+                       image_url: Optional[str] = None, strength: Optional[float] = None) -> List[Any]:
+        """Generate `count` images, packing up to four into each fal request.
+
+        The endpoint's ``num_images`` returns several images for one queue
+        slot; request k of a larger batch is seeded ``seed + k``. Pass
+        `image_url` (a fal URL) and `strength` for image-to-image.
+
+        Returns:
+            PIL images, in order.
+        """
+        images = []
+        for k, offset in enumerate(range(0, count, MAX_IMAGES_PER_REQUEST)):
+            n = min(MAX_IMAGES_PER_REQUEST, count - offset)
+            images.extend(self._request(prompt, steps, seed + k, n, image_url=image_url, strength=strength))
+        return images
+
+    def generate_many(self, prompt: str, steps: int, count: int, max_concurrent: Optional[int] = None,
+                      image_url: Optional[str] = None,
+                      strength: Optional[float] = None) -> Iterator[Tuple[int, Dict[str, Any], Any]]:
+        """Run up to `max_concurrent` fal requests at once (default: system.max_concurrent_images).
+
+        Each request is a generate_batch call carrying up to four images,
+        seeded from one random base seed the same way. Yields
+        (index, params, image-or-exception) in completion order. Requests
+        are submitted as earlier ones finish, so a caller that stops
+        iterating early leaves at most `max_concurrent` requests running
+        and none queued.
+        """
+        if count <= 0:
+            return
+        if max_concurrent is None:
+            from directors_chair.config.loader import load_config
+            max_concurrent = load_config().get("system", {}).get("max_concurrent_images", DEFAULT_MAX_CONCURRENT_IMAGES)
+        self._resolve_lora_urls()  # resolve (and upload) LoRAs once, before fanning out
+
+        batches = self._plan_batches(count, MAX_IMAGES_PER_REQUEST)
+        workers = max(1, min(int(max_concurrent), len(batches)))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fal-image")
+        running = {}
+
+        def submit_next():
+            if batches:
+                start, seed, n = batches.pop(0)
+                future = pool.submit(self.generate_batch, prompt, steps, seed, n, image_url, strength)
+                running[future] = (start, seed, n)
+
+        try:
+            for _ in range(workers):
+                submit_next()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, seed, n = running.pop(future)
+                    submit_next()
+                    try:
+                        images = future.result()
+                    except Exception as e:
+                        images = [e] * n
+                    if len(images) < n:
+                        images += [RuntimeError(f"fal returned {len(images)} of {n} images")] * (n - len(images))
+                    for k, image in enumerate(images[:n]):
+                        yield start + k, self._batch_params(seed, n, k), image
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _request(self, prompt: str, steps: int, seed: int, num_images: int, verbose: bool = False,
+                 image_url: Optional[str] = None, strength: Optional[float] = None) -> List[Any]:
         from directors_chair.cli.utils import console
 
         loras = self._resolve_lora_urls()
@@ -54,6 +116,8 @@ class FalFluxGenerator(BaseGenerator):
         # flux-lora endpoint is the dev model (high quality, up to 50 steps)
         # flux/dev is the same without LoRA support
         endpoint = "fal-ai/flux-lora" if loras else "fal-ai/flux/dev"
+        if image_url:
+            endpoint += "/image-to-image"
 
         # Clamp steps to endpoint limits
         if steps > 50:
@@ -64,37 +128,37 @@ class FalFluxGenerator(BaseGenerator):
             "num_inference_steps": steps,
             "guidance_scale": 3.5,
             "seed": seed,
+            "num_images": num_images,
             "enable_safety_checker": False,
             "output_format": "png",
-            "image_size": "square_hd",
         }
+        if image_url:
+            arguments["image_url"] = image_url
+            if strength is not None:
+                arguments["strength"] = strength
+        else:
+            arguments["image_size"] = "square_hd"
 
         if loras:
             arguments["loras"] = loras
 
-        console.print(f"  [dim]Submitting to {endpoint}...[/dim]")
-        handler = fal_client.submit(endpoint, arguments=arguments)
-
-        for event in handler.iter_events(with_logs=True):
-            if isinstance(event, fal_client.InProgress):
-                if event.logs:
-                    for log in event.logs:
-                        console.print(f"    [dim]{log['message']}[/dim]")
-
-        result = handler.get()
+        if verbose:
+            console.print(f"  [dim]Submitting to {endpoint}...[/dim]")
+        result = run_job(
+            endpoint, arguments,
+            on_log=(lambda msg: console.print(f"    [dim]{msg}[/dim]")) if verbose else None,
+        )
 
         images = result.get("images", [])
         if not images:
             raise RuntimeError(f"No images in fal.ai response: {result}")
 
-        image_url = images[0].get("url")
-        if not image_url:
-            raise RuntimeError(f"No image URL in response: {images[0]}")
+        urls = [img.get("url") for img in images]
+        if not all(urls):
+            raise RuntimeError(f"No image URL in response: {images}")
 
-        result_seed = result.get("seed")
-        console.print(f"  [dim]Generated (seed: {result_seed})[/dim]")
+        if verbose:
+            console.print(f"  [dim]Generated (seed: {result.get('seed')})[/dim]")
 
-        # Download and return as PIL Image
-        response = requests.get(image_url)
-        response.raise_for_status()
-        return Image.open(io.BytesIO(response.content))
+        # Download and return as PIL Images
+        return [Image.open(io.BytesIO(download_bytes(url))) for url in urls]
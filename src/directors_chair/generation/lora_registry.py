@@ -0,0 +1,114 @@
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from directors_chair.config.loader import DEFAULT_CONFIG_PATH, load_config, update_config
+from directors_chair.hashing import file_sha256
+
+
+def _path_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+class LoraRegistry:
+    """Index of the ``loras`` section of config.json by local file path.
+
+    Built once per config version (the file's mtime and size), so looking
+    up a LoRA's fal URL is a dict hit instead of a config reload and scan.
+    LoRAs without a ``fal_url`` are uploaded through the content-hashed
+    upload cache and the resulting URL is written back to their config
+    entry, together with the file's hash so a retrained LoRA is uploaded
+    again.
+    """
+
+    def __init__(self, config_path: str = DEFAULT_CONFIG_PATH):
+        self.config_path = config_path
+        self._lock = threading.Lock()
+        self._upload_lock = threading.Lock()
+        self._version: Optional[Tuple[int, int]] = None
+        self._by_path: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+    def _config_version(self) -> Tuple[int, int]:
+        st = os.stat(self.config_path)
+        return st.st_mtime_ns, st.st_size
+
+    def _index(self) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        version = self._config_version()
+        with self._lock:
+            if version != self._version:
+                loras = load_config(self.config_path).get("loras", {})
+                self._by_path = {
+                    _path_key(entry["path"]): (name, entry)
+                    for name, entry in loras.items() if entry.get("path")
+                }
+                self._version = version
+            return self._by_path
+
+    def lookup(self, path: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(name, config entry) of the LoRA stored at `path`, or None if unregistered."""
+        return self._index().get(_path_key(path))
+
+    def fal_url(self, path: str) -> Optional[str]:
+        """Registered fal URL for the LoRA at `path`, if it has one and the file hasn't changed."""
+        found = self.lookup(path)
+        if not found:
+            return None
+        entry = found[1]
+        url = entry.get("fal_url")
+        if url and entry.get("fal_url_sha256") and os.path.exists(path):
+            # URL was recorded for an upload of this file; a retrained file needs a new one
+            if file_sha256(path) != entry["fal_url_sha256"]:
+                return None
+        return url
+
+    def resolve(self, path: str) -> str:
+        """fal URL for a local LoRA file, uploading it once if none is registered.
+
+        Raises:
+            RuntimeError: If the LoRA has no fal URL and the file doesn't exist.
+        """
+        url = self.fal_url(path)
+        if url:
+            return url
+        if not os.path.exists(path):
+            raise RuntimeError(f"LoRA not found and has no fal URL: {path}")
+
+        from directors_chair.cli.utils import console
+        from directors_chair.fal import upload_file
+
+        # One upload and one config write per LoRA, even with parallel generators
+        with self._upload_lock:
+            url = self.fal_url(path)
+            if url:
+                return url
+
+            console.print(f"  [yellow]No fal URL for {path}, uploading...[/yellow]")
+            url = upload_file(path)
+
+            found = self.lookup(path)
+            if found:
+                name = found[0]
+                digest = file_sha256(path)
+
+                def _record(config: Dict[str, Any]):
+                    entry = config.get("loras", {}).get(name)
+                    if entry is not None:
+                        entry["fal_url"] = url
+                        entry["fal_url_sha256"] = digest
+
+                update_config(_record, self.config_path)
+                console.print(f"  [dim]Saved fal URL for LoRA '{name}' to config[/dim]")
+        return url
+
+
+_registry: Optional[LoraRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_lora_registry() -> LoraRegistry:
+    """Process-wide LoRA registry for config/config.json."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = LoraRegistry()
+        return _registry
@@ -0,0 +1,115 @@
+import gc
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+GB = 1024 ** 3
+
+# Rough resident size of each quantized local base model (weights + text encoders)
+ESTIMATED_MODEL_BYTES = {
+    "flux-schnell": int(9.5 * GB),  # Flux1, 4-bit
+    "zimage-turbo": int(7 * GB),    # ZImageTurbo, 8-bit
+}
+DEFAULT_MODEL_BYTES = 8 * GB
+
+
+def _physical_memory() -> Optional[int]:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def default_budget_bytes() -> int:
+    """system.model_memory_budget_gb from config, else half of physical memory."""
+    from directors_chair.config.loader import load_config
+    budget_gb = load_config().get("system", {}).get("model_memory_budget_gb")
+    if budget_gb:
+        return int(float(budget_gb) * GB)
+    total = _physical_memory()
+    return total // 2 if total else 16 * GB
+
+
+def _release_accelerator_memory():
+    """Return freed buffers to the system after dropping a model."""
+    gc.collect()
+    try:
+        import mlx.core as mx
+    except ImportError:
+        return
+    clear = getattr(mx, "clear_cache", None) or getattr(getattr(mx, "metal", None), "clear_cache", None)
+    if clear:
+        clear()
+
+
+class ModelResidency:
+    """LRU set of loaded local generators under a memory budget.
+
+    Entries are keyed by (base model, LoRA set). mflux fuses LoRA weights
+    into the base at load time, so a base can't be re-targeted to other
+    LoRAs in place; instead, loading a new LoRA variant of a base first
+    evicts the resident variants of that base, so one base model's weights
+    are never held twice. Other bases are evicted least-recently-used until
+    the new model fits. The most recently used model always stays resident,
+    even if it alone exceeds the budget.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        self._models: "OrderedDict[Tuple[str, Tuple[str, ...]], Tuple[Any, int]]" = OrderedDict()
+
+    def resident_bytes(self) -> int:
+        return sum(size for _, size in self._models.values())
+
+    def get(self, base: str, lora_paths: Optional[list], loader: Callable[[], Any],
+            size_bytes: Optional[int] = None) -> Any:
+        """Resident generator for `base` + `lora_paths`, loading it with `loader` if needed.
+
+        Args:
+            base: Base model token (e.g. "flux-schnell").
+            lora_paths: LoRA files fused into this variant.
+            loader: Builds the generator on a miss.
+            size_bytes: Resident size estimate (default: ESTIMATED_MODEL_BYTES by token).
+        """
+        key = (base, tuple(sorted(lora_paths or [])))
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key][0]
+
+            size = size_bytes or ESTIMATED_MODEL_BYTES.get(base, DEFAULT_MODEL_BYTES)
+            for other in [k for k in self._models if k[0] == base]:
+                self._evict(other, "LoRA set changed")
+            while self._models and self.resident_bytes() + size > self.budget_bytes:
+                self._evict(next(iter(self._models)), "memory budget")
+
+            generator = loader()
+            self._models[key] = (generator, size)
+            return generator
+
+    def _evict(self, key, reason: str):
+        from directors_chair.cli.utils import console
+        self._models.pop(key, None)
+        loras = f" + {len(key[1])} LoRA(s)" if key[1] else ""
+        console.print(f"  [dim]Unloading {key[0]}{loras} ({reason})[/dim]")
+        _release_accelerator_memory()
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._models):
+                self._evict(key, "cleared")
+
+
+_residency: Optional[ModelResidency] = None
+_residency_lock = threading.Lock()
+
+
+def get_model_residency() -> ModelResidency:
+    """Process-wide residency manager for local generators."""
+    global _residency
+    with _residency_lock:
+        if _residency is None:
+            _residency = ModelResidency(default_budget_bytes())
+        return _residency
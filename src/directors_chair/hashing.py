@@ -0,0 +1,43 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Tuple
+
+_CHUNK_SIZE = 1024 * 1024
+
+_digests: Dict[Tuple[str, int, int], str] = {}
+_digests_lock = threading.Lock()
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file's contents.
+
+    Memoized per process on (path, mtime, size), so hashing the same
+    multi-megabyte reference image for every shot costs one stat call.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _digests_lock:
+        digest = _digests.get(key)
+    if digest:
+        return digest
+
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+
+    with _digests_lock:
+        _digests[key] = digest
+    return digest
+
+
+def text_sha256(*parts) -> str:
+    """SHA-256 over several values, each stringified and separated."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
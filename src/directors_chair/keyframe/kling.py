@@ -1,11 +1,12 @@
 import io
 import os
-import requests
 from typing import Dict, Any, Optional, List
 
-import fal_client
 from PIL import Image
 
+from directors_chair.fal import download_bytes, run_job, upload_files
+from directors_chair.video.metadata import index_media
+
 
 MAX_ELEMENTS_PER_PASS = 2
 
@@ -15,24 +16,21 @@ def _run_kling_i2i(prompt, image_url, elements, aspect_ratio, resolution):
     from directors_chair.cli.utils import console
 
     with console.status("[cyan]Generating via Kling O3 i2i...[/cyan]") as status:
-        handler = fal_client.submit(
+        def on_log(msg):
+            console.print(f"  [dim]  kling: {msg}[/dim]")
+            status.update(f"[cyan]{msg}[/cyan]")
+
+        result = run_job(
             "fal-ai/kling-image/o3/image-to-image",
-            arguments={
+            {
                 "prompt": prompt,
                 "image_urls": [image_url],
                 "elements": elements,
                 "aspect_ratio": aspect_ratio,
                 "resolution": resolution,
             },
+            on_log=on_log,
         )
-        for event in handler.iter_events(with_logs=True):
-            if isinstance(event, fal_client.InProgress):
-                if event.logs:
-                    for log in event.logs:
-                        msg = log.get('message', '') if isinstance(log, dict) else str(log)
-                        console.print(f"  [dim]  kling: {msg}[/dim]")
-                        status.update(f"[cyan]{msg}[/cyan]")
-        result = handler.get()
 
     # Log full response keys for debugging
     for key in result:
@@ -57,12 +55,12 @@ def _upload_and_build_elements(char_names, characters):
     """Upload character references and build Kling elements list."""
     from directors_chair.cli.utils import console
 
+    ref_paths = [characters[c]["reference_image"] for c in char_names]
+    with console.status(f"[cyan]Uploading {', '.join(char_names)} references...[/cyan]"):
+        ref_urls = upload_files(ref_paths)
+
     elements = []
-    for char_name in char_names:
-        char_def = characters[char_name]
-        ref_path = char_def["reference_image"]
-        with console.status(f"[cyan]Uploading {char_name} reference...[/cyan]"):
-            ref_url = fal_client.upload_file(ref_path)
+    for char_name, ref_url in zip(char_names, ref_urls):
         elements.append({
             "frontal_image_url": ref_url,
             "reference_image_urls": [ref_url],
@@ -99,9 +97,15 @@ def generate_keyframe_kling(
     aspect_ratio = params.get("aspect_ratio", "16:9")
     resolution = params.get("resolution", "2K")
 
-    # Upload composition reference
+    # Upload the composition and every referenced character up front, in
+    # parallel; per-pass element building then hits the upload cache.
+    if keyframe_passes:
+        used_chars = list(dict.fromkeys(c for kp in keyframe_passes for c in kp["characters"]))
+    else:
+        used_chars = list(characters.keys())
+    ref_paths = [characters[c]["reference_image"] for c in used_chars if c in characters]
     with console.status("[cyan]Uploading composition reference...[/cyan]"):
-        comp_url = fal_client.upload_file(comp_image_path)
+        comp_url = upload_files([comp_image_path] + ref_paths)[0]
 
     if keyframe_passes:
         # Multi-pass mode
@@ -142,10 +146,9 @@ def generate_keyframe_kling(
         return False
 
     # Download final result
-    response = requests.get(result_url)
-    response.raise_for_status()
-    img = Image.open(io.BytesIO(response.content))
+    img = Image.open(io.BytesIO(download_bytes(result_url)))
     img.save(output_path)
+    index_media(output_path)
 
     size_kb = os.path.getsize(output_path) // 1024
     console.print(f"  [green]Keyframe saved: {os.path.basename(output_path)} ({size_kb}KB)[/green]")
@@ -2,12 +2,13 @@ import io
 import os
 import re
 import time
-import requests
 from typing import Dict, Any, Optional
 
-import fal_client
 from PIL import Image
 
+from directors_chair.fal import download_bytes, run_job, upload_files
+from directors_chair.video.metadata import index_media
+
 
 def _translate_prompt(prompt: str, characters: Dict[str, Any], has_anchor: bool = False) -> str:
     """Translate @Image1/@Anchor/@ElementN syntax to positional image references for Gemini.
@@ -70,28 +71,19 @@ def generate_keyframe_nano_banana(
 
     has_anchor = anchor_keyframe_path is not None and os.path.exists(anchor_keyframe_path)
 
-    # Upload composition reference
-    with console.status("[cyan]Uploading composition reference...[/cyan]"):
-        comp_url = fal_client.upload_file(comp_image_path)
-    console.print(f"  [dim]composition: uploaded[/dim]")
-
-    image_urls = [comp_url]
+    # Upload composition, anchor and character references concurrently
+    char_names = list(characters.keys())
+    upload_paths = [comp_image_path]
+    if has_anchor:
+        upload_paths.append(anchor_keyframe_path)
+    upload_paths.extend(characters[c]["reference_image"] for c in char_names)
 
-    # Upload anchor keyframe if provided
+    with console.status(f"[cyan]Uploading {len(upload_paths)} reference images...[/cyan]"):
+        image_urls = upload_files(upload_paths)
+    console.print(f"  [dim]composition: uploaded[/dim]")
     if has_anchor:
-        with console.status("[cyan]Uploading anchor keyframe...[/cyan]"):
-            anchor_url = fal_client.upload_file(anchor_keyframe_path)
-        image_urls.append(anchor_url)
         console.print(f"  [dim]anchor keyframe: uploaded[/dim]")
-
-    # Upload character references
-    char_names = list(characters.keys())
     for char_name in char_names:
-        char_def = characters[char_name]
-        ref_path = char_def["reference_image"]
-        with console.status(f"[cyan]Uploading {char_name} reference...[/cyan]"):
-            ref_url = fal_client.upload_file(ref_path)
-        image_urls.append(ref_url)
         console.print(f"  [dim]{char_name}: uploaded[/dim]")
 
     # Build preamble explaining each image
@@ -133,9 +125,13 @@ def generate_keyframe_nano_banana(
     for attempt in range(max_retries):
         try:
             with console.status("[cyan]Generating keyframe via Nano Banana Pro (Gemini)...[/cyan]") as status:
-                handler = fal_client.submit(
+                def on_log(msg):
+                    console.print(f"  [dim]  gemini: {msg}[/dim]")
+                    status.update(f"[cyan]{msg}[/cyan]")
+
+                result = run_job(
                     "fal-ai/nano-banana-pro/edit",
-                    arguments={
+                    {
                         "prompt": full_prompt,
                         "image_urls": image_urls,
                         "aspect_ratio": aspect_ratio,
@@ -143,15 +139,8 @@ def generate_keyframe_nano_banana(
                         "output_format": "png",
                         "num_images": num_images,
                     },
+                    on_log=on_log,
                 )
-                for event in handler.iter_events(with_logs=True):
-                    if isinstance(event, fal_client.InProgress):
-                        if event.logs:
-                            for log in event.logs:
-                                msg = log.get('message', '') if isinstance(log, dict) else str(log)
-                                console.print(f"  [dim]  gemini: {msg}[/dim]")
-                                status.update(f"[cyan]{msg}[/cyan]")
-                result = handler.get()
                 break  # Success
         except Exception as e:
             err_str = str(e)
@@ -182,10 +171,9 @@ def generate_keyframe_nano_banana(
     if num_images == 1:
         # Single image — save directly to output_path
         image_url = images[0]["url"]
-        resp = requests.get(image_url)
-        resp.raise_for_status()
-        img = Image.open(io.BytesIO(resp.content))
+        img = Image.open(io.BytesIO(download_bytes(image_url)))
         img.save(output_path)
+        index_media(output_path)
         size_kb = os.path.getsize(output_path) // 1024
         console.print(f"  [green]Keyframe saved: {os.path.basename(output_path)} ({size_kb}KB)[/green]")
     else:
@@ -197,10 +185,9 @@ def generate_keyframe_nano_banana(
             if not url:
                 continue
             vpath = f"{base}_v{vi + 1}{ext}"
-            resp = requests.get(url)
-            resp.raise_for_status()
-            img = Image.open(io.BytesIO(resp.content))
+            img = Image.open(io.BytesIO(download_bytes(url)))
             img.save(vpath)
+            index_media(vpath)
             size_kb = os.path.getsize(vpath) // 1024
             console.print(f"  [green]Variant {vi + 1}: {os.path.basename(vpath)} ({size_kb}KB)[/green]")
             variant_paths.append(vpath)
@@ -235,20 +222,22 @@ def edit_keyframe(
     aspect_ratio = params.get("aspect_ratio", "16:9")
     resolution = params.get("resolution", "2K")
 
-    # Upload the existing keyframe
-    with console.status("[cyan]Uploading keyframe for editing...[/cyan]"):
-        keyframe_url = fal_client.upload_file(keyframe_path)
-    console.print(f"  [dim]keyframe: uploaded[/dim]")
-
-    # Build image_urls: keyframe first, then character references
-    image_urls = [keyframe_url]
+    # Upload the keyframe and character references concurrently
+    ref_names = []
+    upload_paths = [keyframe_path]
     if characters:
         for char_name, char_info in characters.items():
             ref_path = char_info.get("reference_image", "")
             if ref_path and os.path.exists(ref_path):
-                char_url = fal_client.upload_file(ref_path)
-                image_urls.append(char_url)
-                console.print(f"  [dim]{char_name}: uploaded[/dim]")
+                ref_names.append(char_name)
+                upload_paths.append(ref_path)
+
+    # image_urls: keyframe first, then character references
+    with console.status("[cyan]Uploading keyframe for editing...[/cyan]"):
+        image_urls = upload_files(upload_paths)
+    console.print(f"  [dim]keyframe: uploaded[/dim]")
+    for char_name in ref_names:
+        console.print(f"  [dim]{char_name}: uploaded[/dim]")
 
     console.print(f"  [dim]Images: {len(image_urls)} (1 keyframe + {len(image_urls) - 1} character refs)[/dim]")
 
@@ -264,9 +253,13 @@ def edit_keyframe(
     for attempt in range(max_retries):
         try:
             with console.status("[cyan]Editing keyframe via Gemini 3 Pro...[/cyan]") as status:
-                handler = fal_client.submit(
+                def on_log(msg):
+                    console.print(f"  [dim]  gemini: {msg}[/dim]")
+                    status.update(f"[cyan]{msg}[/cyan]")
+
+                result = run_job(
                     "fal-ai/nano-banana-pro/edit",
-                    arguments={
+                    {
                         "prompt": full_prompt,
                         "image_urls": image_urls,
                         "aspect_ratio": aspect_ratio,
@@ -274,15 +267,8 @@ def edit_keyframe(
                         "output_format": "png",
                         "num_images": 1,
                     },
+                    on_log=on_log,
                 )
-                for event in handler.iter_events(with_logs=True):
-                    if isinstance(event, fal_client.InProgress):
-                        if event.logs:
-                            for log in event.logs:
-                                msg = log.get('message', '') if isinstance(log, dict) else str(log)
-                                console.print(f"  [dim]  gemini: {msg}[/dim]")
-                                status.update(f"[cyan]{msg}[/cyan]")
-                result = handler.get()
                 break  # Success
         except Exception as e:
             err_str = str(e)
@@ -306,10 +292,9 @@ def edit_keyframe(
         return False
 
     image_url = images[0]["url"]
-    resp = requests.get(image_url)
-    resp.raise_for_status()
-    img = Image.open(io.BytesIO(resp.content))
+    img = Image.open(io.BytesIO(download_bytes(image_url)))
     img.save(output_path)
+    index_media(output_path)
     size_kb = os.path.getsize(output_path) // 1024
     console.print(f"  [green]Edited keyframe saved: {os.path.basename(output_path)} ({size_kb}KB)[/green]")
 
@@ -1,3 +1,13 @@
-from .generator import generate_layout, render_layout
+from .generator import generate_layout, generate_layout_script, generate_layouts, submit_layouts, render_layout, render_layouts_batch
+from .worker import BlenderWorker, get_blender_worker
 
-__all__ = ["generate_layout", "render_layout"]
+__all__ = [
+    "generate_layout",
+    "generate_layout_script",
+    "generate_layouts",
+    "submit_layouts",
+    "render_layout",
+    "render_layouts_batch",
+    "BlenderWorker",
+    "get_blender_worker",
+]
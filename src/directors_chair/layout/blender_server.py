@@ -0,0 +1,98 @@
+"""Layout render loop that runs inside Blender (not importable from the CLI).
+
+Launched by BlenderWorker as:
+
+    blender --background --python blender_server.py -- <port> <token>
+
+or, for a one-shot batch (run_blender_batch):
+
+    blender --background --python blender_server.py -- --batch <manifest.json>
+
+Worker mode connects back to the CLI on localhost and speaks
+newline-delimited JSON:
+
+    -> {"cmd": "init", "template": TEMPLATE_CODE}
+    -> {"cmd": "render", "script": "/abs/path/layout_001_layout.py"}
+    <- {"ok": true} | {"ok": false, "error": "<traceback>"}
+    -> {"cmd": "quit"}
+"""
+import json
+import socket
+import sys
+import traceback
+
+import bpy
+
+
+def _send(stream, msg):
+    stream.write(json.dumps(msg) + "\n")
+    stream.flush()
+
+
+def _run(source, filename, namespace):
+    try:
+        exec(compile(source, filename, "exec"), namespace)
+        return {"ok": True}
+    except KeyboardInterrupt:
+        raise
+    except BaseException:
+        # BaseException so a script calling sys.exit() fails its shot, not the worker
+        return {"ok": False, "error": traceback.format_exc()}
+
+
+def _render(script_path, base_namespace):
+    try:
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+        with open(script_path, "r") as f:
+            source = f.read()
+    except Exception:
+        return {"ok": False, "error": traceback.format_exc()}
+
+    namespace = dict(base_namespace)
+    namespace["__file__"] = script_path
+    return _run(source, script_path, namespace)
+
+
+def batch(manifest_path):
+    """Render every script in the manifest, appending one JSON result line per script."""
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+
+    base_namespace = {"__name__": "__main__"}
+    init = _run(manifest["template"], "<layout template>", base_namespace)
+    with open(manifest["results"], "a") as out:
+        for script_path in manifest["scripts"]:
+            result = _render(script_path, base_namespace) if init["ok"] else dict(init)
+            result["script"] = script_path
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:]
+    if argv[0] == "--batch":
+        batch(argv[1])
+        return
+    port, token = int(argv[0]), argv[1]
+
+    sock = socket.create_connection(("127.0.0.1", port))
+    stream = sock.makefile("rw", encoding="utf-8", newline="\n")
+    _send(stream, {"hello": token})
+
+    base_namespace = {"__name__": "__main__"}
+    for line in stream:
+        msg = json.loads(line)
+        cmd = msg.get("cmd")
+        if cmd == "quit":
+            break
+        if cmd == "init":
+            _send(stream, _run(msg["template"], "<layout template>", base_namespace))
+        elif cmd == "render":
+            _send(stream, _render(msg["script"], base_namespace))
+        else:
+            _send(stream, {"ok": False, "error": f"unknown command: {cmd}"})
+
+    sock.close()
+
+
+main()
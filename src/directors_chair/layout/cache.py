@@ -0,0 +1,112 @@
+import glob
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from directors_chair.hashing import text_sha256
+
+from .templates import TEMPLATE_CODE
+
+OUTPUT_PATH_PLACEHOLDER = "__DIRECTORS_CHAIR_LAYOUT_OUTPUT__"
+
+
+class LayoutScriptCache:
+    """Generated layout scripts keyed by their LLM inputs.
+
+    The key is a hash of the layout prompt and the character lines sent to
+    the LLM (names, body types, builder functions, colors, descriptions).
+    Scripts are stored with their render output path swapped for a
+    placeholder, so any shot with the same inputs can reuse them.
+
+    ``index.json`` records the hash of ``TEMPLATE_CODE`` the scripts were
+    generated against; when the template changes the whole cache is purged.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def _load_index(self) -> Dict:
+        template_hash = text_sha256(TEMPLATE_CODE)
+        index = None
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, "r") as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                index = None
+
+        if index is None or index.get("template_hash") != template_hash:
+            if index is not None:
+                from directors_chair.cli.utils import console
+                console.print("  [dim]Layout template changed — clearing layout script cache[/dim]")
+            for path in glob.glob(os.path.join(self.cache_dir, "*.py")):
+                os.remove(path)
+            index = {"template_hash": template_hash, "entries": {}}
+            self._write_index(index)
+        return index
+
+    def _write_index(self, index: Dict):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    @staticmethod
+    def key(layout_prompt: str, char_desc: str) -> str:
+        return text_sha256(layout_prompt.strip(), char_desc)
+
+    def get(self, key: str, output_path: str) -> Optional[str]:
+        """Cached script retargeted at `output_path`, or None."""
+        with self._lock:
+            if key not in self._index["entries"]:
+                return None
+        script_path = os.path.join(self.cache_dir, f"{key}.py")
+        if not os.path.exists(script_path):
+            return None
+        with open(script_path, "r") as f:
+            script = f.read()
+        return script.replace(OUTPUT_PATH_PLACEHOLDER, output_path)
+
+    def put(self, key: str, script: str, output_path: str, layout_prompt: str = "") -> bool:
+        """Store a script. Skipped (returns False) if its output path can't be found to retarget."""
+        if output_path not in script:
+            return False
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(os.path.join(self.cache_dir, f"{key}.py"), "w") as f:
+            f.write(script.replace(output_path, OUTPUT_PATH_PLACEHOLDER))
+        with self._lock:
+            self._index["entries"][key] = {
+                "prompt": layout_prompt[:120],
+                "created_at": time.time(),
+            }
+            self._write_index(self._index)
+        return True
+
+    def discard(self, key: str):
+        """Drop an entry, e.g. because its script failed to render."""
+        with self._lock:
+            if self._index["entries"].pop(key, None) is None:
+                return
+            self._write_index(self._index)
+        script_path = os.path.join(self.cache_dir, f"{key}.py")
+        if os.path.exists(script_path):
+            os.remove(script_path)
+
+
+_caches: Dict[str, LayoutScriptCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_layout_cache(cache_dir: str) -> LayoutScriptCache:
+    """Shared LayoutScriptCache for a directory (one per process)."""
+    cache_dir = os.path.abspath(cache_dir)
+    with _caches_lock:
+        if cache_dir not in _caches:
+            _caches[cache_dir] = LayoutScriptCache(cache_dir)
+        return _caches[cache_dir]
@@ -1,7 +1,14 @@
 import os
 import subprocess
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .templates import TEMPLATE_CODE, CHARACTER_COLORS, BODY_TYPE_BUILDERS
+from .cache import LayoutScriptCache, get_layout_cache
+from .worker import get_blender_worker, run_blender_batch
+
+DEFAULT_MAX_CONCURRENT_LAYOUTS = 4
 
 
 def _strip_compositing_nodes(script: str) -> str:
@@ -34,23 +41,152 @@ def _strip_compositing_nodes(script: str) -> str:
     return script
 
 
-def generate_layout(layout_prompt: str, characters: dict, output_path: str) -> bool:
+def generate_layout(
+    layout_prompt: str,
+    characters: dict,
+    output_path: str,
+    cache_dir: Optional[str] = None,
+    refresh: bool = False,
+) -> bool:
     """Generate a Blender layout frame using Claude Code CLI.
 
     Args:
         layout_prompt: Natural language description of the scene layout
         characters: Dict of character definitions with body_type, description
         output_path: Where to save the rendered PNG
+        cache_dir: Optional layout script cache directory (see LayoutScriptCache)
+        refresh: Ignore a cached script and ask the LLM for a new one
 
     Returns:
         True if layout was generated successfully
     """
+    script_path = generate_layout_script(layout_prompt, characters, output_path, cache_dir, refresh)
+    if script_path is None:
+        return False
+    ok = render_layout(script_path, output_path)
+    if not ok and cache_dir:
+        _discard_cached_script(layout_prompt, characters, cache_dir)
+    return ok
+
+
+def generate_layouts(
+    requests: List[Tuple[str, str]],
+    characters: dict,
+    max_concurrent: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    refresh: bool = False,
+    on_done: Optional[Callable[[str, bool], None]] = None,
+) -> Dict[str, bool]:
+    """Generate and render many layouts, overlapping LLM calls with Blender.
+
+    Scripts are generated by up to `max_concurrent` concurrent ``claude``
+    processes (default: system.max_concurrent_layouts). With the Blender
+    worker enabled, each script is rendered as soon as it arrives, so
+    Blender works on shot 1 while later scripts are still being written.
+    Without the worker, the scripts are rendered in one batch at the end.
+
+    Args:
+        requests: (layout_prompt, output_path) pairs
+        characters: Dict of character definitions with body_type, description
+        max_concurrent: Max concurrent script generations
+        cache_dir: Optional layout script cache directory (see LayoutScriptCache)
+        refresh: Ignore cached scripts and ask the LLM for new ones
+        on_done: Called with (output_path, ok) as soon as each layout's outcome is known
+
+    Returns:
+        {output_path: ok} for every request
+    """
     from directors_chair.cli.utils import console
+    from directors_chair.config.loader import load_config
 
-    # Ensure absolute path so Blender finds the output
-    output_path = os.path.abspath(output_path)
+    if not requests:
+        return {}
+
+    system = load_config().get("system", {})
+    if max_concurrent is None:
+        max_concurrent = system.get("max_concurrent_layouts", DEFAULT_MAX_CONCURRENT_LAYOUTS)
+    render_as_ready = system.get("blender_worker", True)
+
+    results = {}
+    deferred = []
+    workers = max(1, min(int(max_concurrent), len(requests)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="layout-llm") as pool:
+        futures = {
+            pool.submit(generate_layout_script, layout_prompt, characters, output_path, cache_dir, refresh): output_path
+            for layout_prompt, output_path in requests
+        }
+        for future in as_completed(futures):
+            output_path = futures[future]
+            try:
+                script_path = future.result()
+            except Exception as e:
+                console.print(f"[red]Layout script failed for {os.path.basename(output_path)}: {e}[/red]")
+                script_path = None
+            if script_path is None:
+                results[output_path] = False
+            elif render_as_ready:
+                results.update(render_layouts_batch([(script_path, output_path)]))
+            else:
+                deferred.append((script_path, output_path))
+                continue
+            if on_done:
+                on_done(output_path, results[output_path])
+
+    batch_results = render_layouts_batch(deferred)
+    results.update(batch_results)
+    if on_done:
+        for output_path, ok in batch_results.items():
+            on_done(output_path, ok)
+
+    if cache_dir:
+        for layout_prompt, output_path in requests:
+            if not results.get(output_path):
+                _discard_cached_script(layout_prompt, characters, cache_dir)
+    return results
+
+
+def submit_layouts(
+    requests: List[Tuple[str, str]],
+    characters: dict,
+    max_concurrent: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    refresh: bool = False,
+) -> Dict[str, "Future[bool]"]:
+    """Run generate_layouts in the background, with one future per layout.
+
+    Each future resolves to that layout's ok flag as soon as it is rendered,
+    so a caller can start work on shot 1 while later layouts are still being
+    written. (Without the Blender worker, layouts render in one batch and
+    resolve together at the end.)
 
-    # Build character description for the LLM
+    Returns:
+        {output_path: Future[bool]} for every request
+    """
+    futures: Dict[str, Future] = {output_path: Future() for _, output_path in requests}
+
+    def on_done(output_path: str, ok: bool):
+        future = futures.get(output_path)
+        if future is not None and not future.done():
+            future.set_result(ok)
+
+    def run():
+        try:
+            generate_layouts(requests, characters, max_concurrent, cache_dir, refresh, on_done=on_done)
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for future in futures.values():
+                if not future.done():
+                    future.set_result(False)
+
+    threading.Thread(target=run, name="layouts", daemon=True).start()
+    return futures
+
+
+def _character_desc(characters: dict) -> str:
+    """Character lines given to the LLM (order matters: it picks the color)."""
     char_lines = []
     for i, (name, cdef) in enumerate(characters.items()):
         body_type = cdef.get("body_type", "regular_male")
@@ -61,7 +197,54 @@ def generate_layout(layout_prompt: str, characters: dict, output_path: str) -> b
             f"- {name}: body_type={body_type}, builder function={builder}(), "
             f"color={color}, description='{desc}'"
         )
-    char_desc = "\n".join(char_lines)
+    return "\n".join(char_lines)
+
+
+def _discard_cached_script(layout_prompt: str, characters: dict, cache_dir: str):
+    """Forget a cached script that failed to render so the next run regenerates it."""
+    get_layout_cache(cache_dir).discard(LayoutScriptCache.key(layout_prompt, _character_desc(characters)))
+
+
+def generate_layout_script(
+    layout_prompt: str,
+    characters: dict,
+    output_path: str,
+    cache_dir: Optional[str] = None,
+    refresh: bool = False,
+) -> Optional[str]:
+    """Generate the Blender script for a layout without rendering it.
+
+    With `cache_dir`, a script previously generated from the same prompt,
+    characters and template is reused instead of calling the LLM.
+
+    Args:
+        layout_prompt: Natural language description of the scene layout
+        characters: Dict of character definitions with body_type, description
+        output_path: Where the script should render its PNG
+        cache_dir: Optional layout script cache directory (see LayoutScriptCache)
+        refresh: Ignore a cached script and ask the LLM for a new one
+
+    Returns:
+        Path of the saved ``*_layout.py`` script, or None on failure
+    """
+    from directors_chair.cli.utils import console
+
+    # Ensure absolute path so Blender finds the output
+    output_path = os.path.abspath(output_path)
+
+    # Build character description for the LLM
+    char_desc = _character_desc(characters)
+    script_path = output_path.replace(".png", "_layout.py")
+
+    cache = get_layout_cache(cache_dir) if cache_dir else None
+    cache_key = LayoutScriptCache.key(layout_prompt, char_desc) if cache else None
+    if cache and not refresh:
+        script = cache.get(cache_key, output_path)
+        if script is not None:
+            with open(script_path, "w") as f:
+                f.write(script)
+            console.print(f"  [dim]Reusing cached layout script: {os.path.basename(script_path)}[/dim]")
+            return script_path
 
     system_prompt = (
         "You are a Blender Python script generator. "
@@ -102,7 +285,7 @@ Rules:
 - NEVER use world.use_nodes or world.node_tree — also removed in Blender 5.x
 - For scope/vignette effects, skip compositing — just render the raw scene"""
 
-    console.print("  [dim]Generating Blender script via Claude...[/dim]")
+    console.print(f"  [dim]Generating Blender script via Claude ({os.path.basename(output_path)})...[/dim]")
 
     # Unset CLAUDECODE env var to allow nested invocation
     env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
@@ -118,7 +301,7 @@ Rules:
         console.print(f"[red]Claude CLI failed (exit {result.returncode})[/red]")
         if result.stderr:
             console.print(f"[red]{result.stderr[:500]}[/red]")
-        return False
+        return None
 
     script = result.stdout.strip()
 
@@ -140,7 +323,7 @@ Rules:
             capture_output=True, text=True, env=env,
         )
         if result.returncode != 0:
-            return False
+            return None
         script = result.stdout.strip()
         if "```" in script:
             lines = script.split("\n")
@@ -151,43 +334,118 @@ Rules:
     script = _strip_compositing_nodes(script)
 
     # Save script for Blender to execute
-    script_path = output_path.replace(".png", "_layout.py")
     with open(script_path, "w") as f:
         f.write(script)
+    if cache:
+        cache.put(cache_key, script, output_path, layout_prompt)
 
     console.print(f"  [dim]Script saved: {script_path}[/dim]")
-    return render_layout(script_path, output_path)
+    return script_path
+
+
+def _run_blender_once(blender_path: str, script_path: str):
+    """Run a script in a fresh headless Blender. Returns (ok, stderr)."""
+    result = subprocess.run(
+        [blender_path, "--background", "--python", script_path],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return False, f"exit {result.returncode}\n{result.stderr or ''}"
+    return True, ""
 
 
 def render_layout(script_path: str, output_path: str) -> bool:
-    """Run a Blender script headless and verify output."""
+    """Run a Blender script headless and verify output.
+
+    Uses the persistent Blender worker unless system.blender_worker is
+    false, falling back to a one-shot Blender process if the worker fails.
+    """
     from directors_chair.cli.utils import console
     from directors_chair.config.loader import load_config
 
     config = load_config()
-    blender_path = config.get("system", {}).get(
-        "blender_path",
-        "/Applications/Blender.app/Contents/MacOS/Blender"
-    )
+    blender_path = _blender_path(config)
 
     if not os.path.exists(blender_path):
         console.print(f"[red]Blender not found at: {blender_path}[/red]")
         console.print("[yellow]Set system.blender_path in config.json[/yellow]")
         return False
 
-    console.print("  [dim]Running Blender headless...[/dim]")
+    worker = get_blender_worker(blender_path) if config.get("system", {}).get("blender_worker", True) else None
+    ok = None
+    if worker is not None and not worker.unavailable:
+        console.print("  [dim]Rendering in Blender worker...[/dim]")
+        try:
+            ok, error = worker.render(script_path)
+        except RuntimeError as e:
+            console.print(f"  [yellow]{e} — falling back to one-shot Blender[/yellow]")
+    if ok is None:
+        console.print("  [dim]Running Blender headless...[/dim]")
+        ok, error = _run_blender_once(blender_path, script_path)
 
-    result = subprocess.run(
-        [blender_path, "--background", "--python", script_path],
-        capture_output=True, text=True,
+    return _check_render(output_path, ok, error)
+
+
+def render_layouts_batch(jobs: List[Tuple[str, str]]) -> Dict[str, bool]:
+    """Render many layout scripts in a single Blender process.
+
+    Each script runs against a factory-reset scene in its own namespace, so
+    a failing script only fails its own shot.
+
+    Args:
+        jobs: (script_path, output_path) pairs
+
+    Returns:
+        {output_path: ok} for every job
+    """
+    from directors_chair.cli.utils import console
+    from directors_chair.config.loader import load_config
+
+    if not jobs:
+        return {}
+
+    config = load_config()
+    blender_path = _blender_path(config)
+    if not os.path.exists(blender_path):
+        console.print(f"[red]Blender not found at: {blender_path}[/red]")
+        console.print("[yellow]Set system.blender_path in config.json[/yellow]")
+        return {output_path: False for _, output_path in jobs}
+
+    script_paths = [script_path for script_path, _ in jobs]
+    outcomes = None
+    worker = get_blender_worker(blender_path) if config.get("system", {}).get("blender_worker", True) else None
+    if worker is not None and not worker.unavailable:
+        console.print(f"  [dim]Rendering {len(jobs)} layout(s) in Blender worker...[/dim]")
+        try:
+            outcomes = worker.render_many(script_paths)
+        except RuntimeError as e:
+            console.print(f"  [yellow]{e} — falling back to a batch Blender run[/yellow]")
+    if outcomes is None:
+        console.print(f"  [dim]Rendering {len(jobs)} layout(s) in one Blender run...[/dim]")
+        outcomes = run_blender_batch(blender_path, script_paths)
+
+    results = {}
+    for (script_path, output_path), (ok, error) in zip(jobs, outcomes):
+        results[output_path] = _check_render(output_path, ok, error)
+    return results
+
+
+def _blender_path(config) -> str:
+    return config.get("system", {}).get(
+        "blender_path",
+        "/Applications/Blender.app/Contents/MacOS/Blender"
     )
 
-    if result.returncode != 0:
-        console.print(f"[red]Blender failed (exit {result.returncode})[/red]")
-        if result.stderr:
-            for line in result.stderr.split("\n"):
-                if "Error" in line or "error" in line:
-                    console.print(f"  [red]{line}[/red]")
+
+def _check_render(output_path: str, ok: bool, error: str) -> bool:
+    """Report a render outcome and verify the PNG exists."""
+    from directors_chair.cli.utils import console
+
+    if not ok:
+        console.print(f"[red]Blender failed: {os.path.basename(output_path)}[/red]")
+        for line in error.split("\n"):
+            if "Error" in line or "error" in line:
+                console.print(f"  [red]{line}[/red]")
         return False
 
     if not os.path.exists(output_path):
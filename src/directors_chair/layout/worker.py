@@ -0,0 +1,252 @@
+import atexit
+import json
+import os
+import secrets
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from .templates import TEMPLATE_CODE
+
+DEFAULT_STARTUP_TIMEOUT = 60
+DEFAULT_RENDER_TIMEOUT = 600
+ACCEPT_POLL_SECONDS = 0.5
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blender_server.py")
+
+
+class BlenderWorker:
+    """A long-lived headless Blender that renders layout scripts on request.
+
+    Blender is started once with ``blender_server.py``, which connects back
+    over a localhost socket and executes ``TEMPLATE_CODE`` a single time.
+    Each ``render()`` then resets the scene with ``read_factory_settings``
+    and runs the layout script in a fresh copy of that namespace, so shots
+    skip Blender's startup cost without sharing scene state.
+
+    Renders are serialized — Blender has one scene. Transport failures
+    (Blender crashed or timed out mid-render) raise RuntimeError and the
+    process is torn down; the next ``render()`` starts a new one. If
+    Blender can't be started at all, the failure is remembered in
+    ``start_error`` and later renders raise at once instead of waiting out
+    another startup timeout.
+    """
+
+    def __init__(self, blender_path: str,
+                 startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+                 render_timeout: float = DEFAULT_RENDER_TIMEOUT):
+        self.blender_path = blender_path
+        self.startup_timeout = startup_timeout
+        self.render_timeout = render_timeout
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._sock: Optional[socket.socket] = None
+        self._stream = None
+        self.start_error: Optional[str] = None
+
+    @property
+    def unavailable(self) -> bool:
+        """True once a start has failed; callers should use one-shot Blender instead."""
+        return self.start_error is not None
+
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None and self._stream is not None
+
+    def _start(self):
+        token = secrets.token_hex(16)
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(1)
+            listener.settimeout(ACCEPT_POLL_SECONDS)
+            port = listener.getsockname()[1]
+
+            try:
+                self._proc = subprocess.Popen(
+                    [self.blender_path, "--background", "--python", SERVER_SCRIPT, "--", str(port), token],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                )
+            except OSError as e:
+                raise RuntimeError(f"Could not start Blender worker: {e}")
+            conn = self._accept(listener)
+        except BaseException:
+            self._teardown()
+            raise
+        finally:
+            listener.close()
+
+        self._sock = conn
+        self._sock.settimeout(self.startup_timeout)
+        self._stream = conn.makefile("rw", encoding="utf-8", newline="\n")
+        try:
+            hello = self._recv()
+            if hello.get("hello") != token:
+                raise RuntimeError("Blender worker handshake failed")
+            reply = self._request({"cmd": "init", "template": TEMPLATE_CODE})
+            if not reply.get("ok"):
+                raise RuntimeError(f"Blender worker could not load template:\n{reply.get('error', '')}")
+        except (OSError, ValueError) as e:
+            self._teardown()
+            raise RuntimeError(f"Blender worker handshake failed: {e}")
+        except BaseException:
+            self._teardown()
+            raise
+
+    def _accept(self, listener: socket.socket) -> socket.socket:
+        """Wait for Blender to connect back, giving up early if it exits first."""
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            try:
+                conn, _ = listener.accept()
+                return conn
+            except socket.timeout:
+                pass
+            code = self._proc.poll()
+            if code is not None:
+                raise RuntimeError(f"Blender worker exited ({code}) before connecting")
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Blender worker did not connect within {self.startup_timeout}s")
+
+    def _recv(self) -> dict:
+        line = self._stream.readline()
+        if not line:
+            raise RuntimeError("Blender worker closed the connection")
+        return json.loads(line)
+
+    def _request(self, msg: dict) -> dict:
+        self._stream.write(json.dumps(msg) + "\n")
+        self._stream.flush()
+        return self._recv()
+
+    def _ensure_started(self):
+        if self.alive():
+            return
+        self._teardown()
+        if self.start_error is not None:
+            raise RuntimeError(f"Blender worker unavailable: {self.start_error}")
+        try:
+            self._start()
+        except RuntimeError as e:
+            self.start_error = str(e)
+            raise
+
+    def _render_locked(self, script_path: str) -> Tuple[bool, str]:
+        self._ensure_started()
+        try:
+            self._sock.settimeout(self.render_timeout)
+            reply = self._request({"cmd": "render", "script": os.path.abspath(script_path)})
+        except (OSError, ValueError, RuntimeError) as e:
+            self._teardown()
+            raise RuntimeError(f"Blender worker failed: {e}")
+        return bool(reply.get("ok")), reply.get("error", "")
+
+    def render(self, script_path: str) -> Tuple[bool, str]:
+        """Run one layout script. Returns (ok, error_text)."""
+        with self._lock:
+            return self._render_locked(script_path)
+
+    def render_many(self, script_paths: List[str]) -> List[Tuple[bool, str]]:
+        """Run several layout scripts back to back, holding the worker for the batch.
+
+        Returns (ok, error_text) per script, in order. A script that kills
+        Blender fails alone; the worker restarts for the next script. Raises
+        RuntimeError only if the worker can't be started at all; if a restart
+        fails partway through, the remaining scripts go to a one-shot batch.
+        """
+        with self._lock:
+            self._ensure_started()
+            results = []
+            for i, script_path in enumerate(script_paths):
+                try:
+                    results.append(self._render_locked(script_path))
+                except RuntimeError as e:
+                    if self.unavailable:
+                        results.extend(run_blender_batch(self.blender_path, script_paths[i:]))
+                        break
+                    results.append((False, str(e)))
+            return results
+
+    def _teardown(self):
+        for closeable in (self._stream, self._sock):
+            if closeable is not None:
+                try:
+                    closeable.close()
+                except OSError:
+                    pass
+        self._stream = None
+        self._sock = None
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+    def close(self):
+        """Ask Blender to exit, killing it if it doesn't."""
+        with self._lock:
+            if self.alive():
+                try:
+                    self._stream.write(json.dumps({"cmd": "quit"}) + "\n")
+                    self._stream.flush()
+                    self._proc.wait(timeout=10)
+                except (OSError, ValueError, subprocess.TimeoutExpired):
+                    pass
+            self._teardown()
+
+
+_worker: Optional[BlenderWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_blender_worker(blender_path: str) -> BlenderWorker:
+    """Process-wide Blender worker, shut down at interpreter exit."""
+    global _worker
+    with _worker_lock:
+        if _worker is not None and _worker.blender_path != blender_path:
+            _worker.close()
+            _worker = None
+        if _worker is None:
+            _worker = BlenderWorker(blender_path)
+            atexit.register(_worker.close)
+        return _worker
+
+
+def run_blender_batch(blender_path: str, script_paths: List[str]) -> List[Tuple[bool, str]]:
+    """Render several layout scripts in one short-lived Blender process.
+
+    Used when the persistent worker is disabled or unavailable. If Blender
+    dies partway through, the script it was running is failed and the
+    remaining scripts go to a fresh Blender process.
+    """
+    outcomes = {}
+    pending = [os.path.abspath(p) for p in script_paths]
+    with tempfile.TemporaryDirectory(prefix="dc_layout_batch_") as tmp_dir:
+        attempt = 0
+        while pending:
+            attempt += 1
+            manifest_path = os.path.join(tmp_dir, f"manifest_{attempt}.json")
+            results_path = os.path.join(tmp_dir, f"results_{attempt}.jsonl")
+            with open(manifest_path, "w") as f:
+                json.dump({"template": TEMPLATE_CODE, "scripts": pending, "results": results_path}, f)
+
+            proc = subprocess.run(
+                [blender_path, "--background", "--python", SERVER_SCRIPT, "--", "--batch", manifest_path],
+                capture_output=True, text=True,
+            )
+
+            if os.path.exists(results_path):
+                with open(results_path, "r") as f:
+                    for line in f:
+                        result = json.loads(line)
+                        outcomes[result["script"]] = (bool(result.get("ok")), result.get("error", ""))
+
+            remaining = [p for p in pending if p not in outcomes]
+            if remaining:
+                # The first unfinished script took Blender down with it
+                outcomes[remaining[0]] = (False, f"Blender exited ({proc.returncode}) while rendering\n{proc.stderr or ''}")
+                remaining = remaining[1:]
+            pending = remaining
+
+    return [outcomes[os.path.abspath(p)] for p in script_paths]
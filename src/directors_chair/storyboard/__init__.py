@@ -1,3 +1,6 @@
 from .loader import load_storyboard, validate_storyboard
+from .model import Storyboard, get_storyboard
+from .manifest import BuildManifest
+from .scheduler import ShotScheduler, DEFAULT_MAX_CONCURRENT_SHOTS
 
-__all__ = ["load_storyboard", "validate_storyboard"]
+__all__ = ["load_storyboard", "validate_storyboard", "Storyboard", "get_storyboard", "BuildManifest", "ShotScheduler", "DEFAULT_MAX_CONCURRENT_SHOTS"]
@@ -1,43 +1,76 @@
 import json
 import os
-from typing import Dict, Any, List, Tuple
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+# abspath -> (mtime_ns, size, stripped text)
+_prompt_cache: Dict[str, Tuple[int, int, str]] = {}
+_prompt_cache_lock = threading.Lock()
+
+
+def read_prompt_file(file_path: str) -> str:
+    """Stripped contents of a prompt .txt file, cached per process until it changes on disk."""
+    file_path = os.path.abspath(file_path)
+    st = os.stat(file_path)
+    with _prompt_cache_lock:
+        cached = _prompt_cache.get(file_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+    with open(file_path, "r") as f:
+        text = f.read().strip()
+    with _prompt_cache_lock:
+        _prompt_cache[file_path] = (st.st_mtime_ns, st.st_size, text)
+    return text
 
 
-def _resolve_file_ref(base_dir: str, value: str) -> str:
+def _resolve_file_ref(base_dir: str, value: str, used: Optional[List[str]] = None) -> str:
     """Read a .txt file relative to the storyboard directory."""
     file_path = os.path.join(base_dir, value)
-    with open(file_path, "r") as f:
-        return f.read().strip()
+    if used is not None:
+        used.append(file_path)
+    return read_prompt_file(file_path)
 
 
-def load_storyboard(path: str) -> Dict[str, Any]:
+def parse_storyboard(path: str) -> Tuple[Dict[str, Any], List[str]]:
+    """Read a storyboard JSON and inline its ``*_prompt_file`` references.
+
+    Returns:
+        (storyboard dict, paths of the prompt files it read).
+    """
     base_dir = os.path.dirname(os.path.abspath(path))
 
     with open(path, "r") as f:
         storyboard = json.load(f)
 
+    used: List[str] = []
     for shot in storyboard.get("shots", []):
         # Layout prompt (Blender layout description)
         if "layout_prompt_file" in shot:
-            shot["layout_prompt"] = _resolve_file_ref(base_dir, shot["layout_prompt_file"])
+            shot["layout_prompt"] = _resolve_file_ref(base_dir, shot["layout_prompt_file"], used)
         # Keyframe prompt (Kling i2i) — single prompt for <= 2 characters
         if "keyframe_prompt_file" in shot:
-            shot["keyframe_prompt"] = _resolve_file_ref(base_dir, shot["keyframe_prompt_file"])
+            shot["keyframe_prompt"] = _resolve_file_ref(base_dir, shot["keyframe_prompt_file"], used)
         # Optional keyframe edit prompt (post-generation touch-up)
         if "keyframe_edit_prompt_file" in shot:
-            shot["keyframe_edit_prompt"] = _resolve_file_ref(base_dir, shot["keyframe_edit_prompt_file"])
+            shot["keyframe_edit_prompt"] = _resolve_file_ref(base_dir, shot["keyframe_edit_prompt_file"], used)
         # Keyframe passes (multi-pass for > 2 characters)
         if "keyframe_passes" in shot:
             for kp in shot["keyframe_passes"]:
                 if "prompt_file" in kp:
-                    kp["prompt"] = _resolve_file_ref(base_dir, kp["prompt_file"])
+                    kp["prompt"] = _resolve_file_ref(base_dir, kp["prompt_file"], used)
         # Beats (Kling i2v multi-prompt)
         if "beats" in shot:
             for beat in shot["beats"]:
                 if "prompt_file" in beat:
-                    beat["prompt"] = _resolve_file_ref(base_dir, beat["prompt_file"])
+                    beat["prompt"] = _resolve_file_ref(base_dir, beat["prompt_file"], used)
 
-    return storyboard
+    return storyboard, used
+
+
+def load_storyboard(path: str) -> Dict[str, Any]:
+    """Storyboard dict with prompt files inlined (a private copy of the cached document)."""
+    from .model import get_storyboard
+    return get_storyboard(path).to_dict()
 
 
 VALID_BODY_TYPES = {"large", "regular_male", "regular_female"}
@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from directors_chair.hashing import file_sha256, text_sha256
+
+MANIFEST_NAME = "manifest.json"
+
+
+def fingerprint(*parts) -> str:
+    """Stable hash of JSON-serializable build inputs."""
+    return text_sha256(*(json.dumps(p, sort_keys=True, default=str) for p in parts))
+
+
+def file_fingerprint(path: Optional[str]) -> Optional[str]:
+    """Content hash of an input file, or None if it doesn't exist."""
+    if path and os.path.exists(path):
+        return file_sha256(path)
+    return None
+
+
+def _character_inputs(characters: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        name: {
+            "reference_image": file_fingerprint(cdef.get("reference_image")),
+            "description": cdef.get("description"),
+            "body_type": cdef.get("body_type"),
+            "kling_voice_id": cdef.get("kling_voice_id"),
+        }
+        for name, cdef in characters.items()
+    }
+
+
+def layout_fingerprint(shot: Dict[str, Any], characters: Dict[str, Any]) -> str:
+    """Inputs to a shot's Blender layout: its prompt and the character roster (order picks colors)."""
+    roster = [(name, cdef.get("body_type"), cdef.get("description")) for name, cdef in characters.items()]
+    return fingerprint("layout", shot.get("layout_prompt", ""), roster)
+
+
+def keyframe_fingerprint(
+    shot: Dict[str, Any],
+    characters: Dict[str, Any],
+    engine: str,
+    kling_params: Dict[str, Any],
+    layout_path: str,
+    anchor_keyframe_path: Optional[str] = None,
+) -> str:
+    """Inputs to a shot's keyframe: prompts, references, engine, params and upstream images."""
+    return fingerprint(
+        "keyframe",
+        engine,
+        shot.get("keyframe_prompt"),
+        shot.get("keyframe_passes"),
+        shot.get("keyframe_edit_prompt"),
+        {k: kling_params.get(k) for k in ("aspect_ratio", "resolution")},
+        _character_inputs(characters),
+        file_fingerprint(layout_path),
+        file_fingerprint(anchor_keyframe_path),
+    )
+
+
+def clip_fingerprint(
+    shot: Dict[str, Any],
+    characters: Dict[str, Any],
+    engine: str,
+    kling_params: Dict[str, Any],
+    keyframe_path: str,
+) -> str:
+    """Inputs to a shot's clip: beats, references, engine, params and the start keyframe."""
+    return fingerprint(
+        "clip",
+        engine,
+        [(b.get("prompt"), str(b.get("duration"))) for b in shot.get("beats", [])],
+        kling_params,
+        _character_inputs(characters),
+        file_fingerprint(keyframe_path),
+    )
+
+
+class BuildManifest:
+    """Make-style record of the inputs each storyboard artifact was built from.
+
+    Stored as ``manifest.json`` in the storyboard's output directory and
+    keyed by artifact path relative to it. An artifact is fresh when it
+    exists and its recorded fingerprint matches the current inputs.
+
+    Artifacts that predate the manifest are adopted on first sight (their
+    current fingerprint is recorded) rather than rebuilt, so upgrading
+    doesn't re-bill a finished storyboard.
+    """
+
+    def __init__(self, output_base: str):
+        self.output_base = output_base
+        self.path = os.path.join(output_base, MANIFEST_NAME)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    self._entries = json.load(f).get("artifacts", {})
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def _key(self, artifact_path: str) -> str:
+        return os.path.relpath(os.path.abspath(artifact_path), os.path.abspath(self.output_base))
+
+    def _write(self):
+        os.makedirs(self.output_base, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"artifacts": self._entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def is_fresh(self, artifact_path: str, fp: str, adopt: bool = True) -> bool:
+        """True if `artifact_path` exists and was built from inputs matching `fp`.
+
+        With `adopt`, an existing artifact that has no manifest entry yet is
+        recorded as built from `fp` and counts as fresh.
+        """
+        if not os.path.exists(artifact_path) or os.path.getsize(artifact_path) == 0:
+            return False
+        key = self._key(artifact_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if not adopt:
+                    return False
+                self._entries[key] = {"fingerprint": fp, "built_at": time.time(), "adopted": True}
+                self._write()
+                return True
+            return entry.get("fingerprint") == fp
+
+    def record(self, artifact_path: str, fp: str):
+        """Mark `artifact_path` as built from inputs `fp`."""
+        with self._lock:
+            self._entries[self._key(artifact_path)] = {"fingerprint": fp, "built_at": time.time()}
+            self._write()
+
+    def forget(self, artifact_path: str):
+        with self._lock:
+            if self._entries.pop(self._key(artifact_path), None) is not None:
+                self._write()
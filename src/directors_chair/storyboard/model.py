@@ -0,0 +1,102 @@
+import copy
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .loader import parse_storyboard, validate_storyboard
+
+FileStamp = Optional[Tuple[int, int]]
+
+
+def _stamp(path: str) -> FileStamp:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class Storyboard:
+    """A loaded storyboard: parsed JSON with prompt files inlined, plus a shot index.
+
+    Reads like the storyboard dict (``sb["name"]``, ``sb.get("kling_params")``)
+    and adds ``shot(name)`` lookups in O(1). Remembers the mtime and size of
+    every file it depends on — the JSON, its prompt files and the
+    characters' reference images — so ``is_stale()`` can tell when it needs
+    reloading, and validation runs once per version.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        data, prompt_files = parse_storyboard(self.path)
+        self.data: Dict[str, Any] = data
+        reference_images = [
+            c["reference_image"] for c in (data.get("characters") or {}).values()
+            if isinstance(c, dict) and c.get("reference_image")
+        ]
+        self._stamps: Dict[str, FileStamp] = {
+            p: _stamp(p) for p in [self.path, *prompt_files, *reference_images]
+        }
+        self._by_name: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        for i, shot in enumerate(self.shots):
+            self._by_name.setdefault(shot.get("name"), (i, shot))
+        self._validation: Optional[Tuple[bool, List[str]]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    @property
+    def name(self) -> str:
+        return self.data.get("name", "")
+
+    @property
+    def shots(self) -> List[Dict[str, Any]]:
+        shots = self.data.get("shots")
+        return shots if isinstance(shots, list) else []
+
+    @property
+    def characters(self) -> Dict[str, Any]:
+        return self.data.get("characters") or {}
+
+    def shot(self, name: str) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+        """(index, shot) for a shot name, or (None, None) if there is no such shot."""
+        return self._by_name.get(name, (None, None))
+
+    def validate(self) -> Tuple[bool, List[str]]:
+        """validate_storyboard result, computed once per loaded version."""
+        if self._validation is None:
+            self._validation = validate_storyboard(self.data)
+        return self._validation
+
+    def is_stale(self) -> bool:
+        """True if the JSON, a prompt file or a reference image changed since loading."""
+        return any(_stamp(p) != stamp for p, stamp in self._stamps.items())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Deep copy of the storyboard dict, safe for the caller to modify."""
+        return copy.deepcopy(self.data)
+
+
+_storyboards: Dict[str, Storyboard] = {}
+_storyboards_lock = threading.Lock()
+
+
+def get_storyboard(path: str) -> Storyboard:
+    """Shared Storyboard for `path`, reloaded only when one of its files changed.
+
+    Callers share the instance and must treat it as read-only; use
+    ``to_dict()`` for a copy to modify.
+    """
+    path = os.path.abspath(path)
+    with _storyboards_lock:
+        storyboard = _storyboards.get(path)
+        if storyboard is None or storyboard.is_stale():
+            storyboard = Storyboard(path)
+            _storyboards[path] = storyboard
+        return storyboard
@@ -0,0 +1,101 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_MAX_CONCURRENT_SHOTS = 4
+
+
+class ShotScheduler:
+    """Run one job per shot on a bounded thread pool.
+
+    A job is a callable ``job(shot_name, scheduler) -> bool`` that walks a
+    shot through its stages (layout → keyframe → clip). Jobs report stage
+    results with ``mark()``, and a job that depends on another shot calls
+    ``wait_for()`` — so a shot anchored to an earlier keyframe waits for
+    that keyframe only, not for the earlier shot's whole chain.
+
+    Jobs start in storyboard order and ``anchor_keyframe`` must point at an
+    earlier shot (enforced by ``validate_storyboard``), so the shot being
+    waited on is always already running. Waiting can't starve the pool.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_CONCURRENT_SHOTS):
+        self.max_workers = max(1, int(max_workers))
+        self._cond = threading.Condition()
+        self._scheduled = set()
+        self._stages: Dict[Tuple[str, str], bool] = {}
+        self._finished: Dict[str, bool] = {}
+        self._cancelled = False
+
+    def mark(self, shot_name: str, stage: str, ok: bool = True):
+        """Record the outcome of a shot's stage and wake any waiters."""
+        with self._cond:
+            self._stages[(shot_name, stage)] = ok
+            self._cond.notify_all()
+
+    def wait_for(self, shot_name: str, stage: str) -> bool:
+        """Block until `shot_name` has finished `stage`.
+
+        Returns the stage result. Shots outside this run, and shots whose
+        job ended without running the stage (e.g. the artifact already
+        existed), count as done. Returns False once the run is cancelled.
+        """
+        key = (shot_name, stage)
+        with self._cond:
+            if shot_name not in self._scheduled:
+                return True
+            self._cond.wait_for(lambda: key in self._stages or shot_name in self._finished or self._cancelled)
+            return self._stages.get(key, self._finished.get(shot_name, False))
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        """Stop the run: wake every waiter; jobs not yet started won't start."""
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
+
+    def _run_job(self, shot_name: str, job: Callable[[str, "ShotScheduler"], bool]) -> bool:
+        ok = False
+        if self._cancelled:
+            return ok
+        try:
+            ok = bool(job(shot_name, self))
+        except Exception as e:
+            from directors_chair.cli.utils import console
+            console.print(f"[red]{shot_name}: {type(e).__name__}: {e}[/red]")
+        finally:
+            with self._cond:
+                self._finished[shot_name] = ok
+                self._cond.notify_all()
+        return ok
+
+    def run(self, shot_names: List[str], job: Callable[[str, "ShotScheduler"], bool],
+            on_cancel: Optional[Callable[[], None]] = None) -> Dict[str, bool]:
+        """Run `job` for every shot, at most `max_workers` at a time.
+
+        Returns {shot_name: ok}. A job that raises counts as failed and its
+        pending stages are released so dependent shots don't hang.
+
+        If waiting is interrupted (Ctrl-C), shots that haven't started are
+        dropped, waiters are released, `on_cancel` is called so running jobs
+        can stop blocking (e.g. FalJobRunner.cancel_all), and the exception
+        is re-raised without waiting for the running jobs.
+        """
+        with self._cond:
+            self._scheduled.update(shot_names)
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="shot")
+        try:
+            futures = {name: pool.submit(self._run_job, name, job) for name in shot_names}
+            results = {name: f.result() for name, f in futures.items()}
+        except BaseException:
+            self.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+            if on_cancel is not None:
+                on_cancel()
+            raise
+        pool.shutdown()
+        return results
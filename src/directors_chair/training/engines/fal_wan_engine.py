@@ -1,10 +1,9 @@
 import os
 import zipfile
-import requests
 import fal_client
 from pathlib import Path
 from typing import Optional
-from tqdm import tqdm
+from directors_chair.fal import download_file
 from .base import BaseTrainingEngine
 
 
@@ -88,15 +87,7 @@ class FalWanTrainingEngine(BaseTrainingEngine):
         output_path = os.path.join(output_dir, f"{output_name}.safetensors")
         console.print(f"[cyan]Downloading trained LoRA to {output_path}...[/cyan]")
 
-        response = requests.get(lora_url, stream=True)
-        total_size = int(response.headers.get("content-length", 0))
-        with open(output_path, "wb") as f, tqdm(
-            desc=output_name,
-            total=total_size, unit="iB", unit_scale=True, unit_divisor=1024,
-        ) as bar:
-            for data in response.iter_content(chunk_size=1024):
-                size = f.write(data)
-                bar.update(size)
+        download_file(lora_url, output_path, progress_desc=output_name)
 
         # 6. Cleanup
         zip_path.unlink(missing_ok=True)
@@ -1,3 +1,5 @@
 from .manager import get_kling_engine
+from .assembly import concat_clips, probe_video
+from .metadata import MediaIndex, get_media_index, index_media, media_info
 
-__all__ = ["get_kling_engine"]
+__all__ = ["get_kling_engine", "concat_clips", "probe_video", "MediaIndex", "get_media_index", "index_media", "media_info"]
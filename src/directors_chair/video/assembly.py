@@ -0,0 +1,355 @@
+import os
+import subprocess
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from directors_chair.hashing import file_sha256, text_sha256
+
+from .metadata import media_info
+
+TARGET_WIDTH = 1280
+TARGET_HEIGHT = 720
+TARGET_CODEC = "h264"
+TARGET_PIX_FMT = "yuv420p"
+DEFAULT_FPS = "24/1"
+DEFAULT_TIMESCALE = 12288
+TARGET_AUDIO = {"codec": "aac", "sample_rate": "48000", "channels": 2}
+DEFAULT_FFMPEG_WORKERS = 4
+DEFAULT_MEZZANINE_CACHE_GB = 20
+# Bump when normalize_clip's encoder settings change, to invalidate cached mezzanines
+NORMALIZE_VERSION = 2
+# Bump when concat_clips changes what it writes (e.g. audio handling), to re-stitch final videos
+STITCH_VERSION = 1
+# Puts SPS/PPS in front of every keyframe of a stream-copied H.264 track
+INBAND_HEADERS_BSF = "h264_mp4toannexb"
+
+
+def probe_video(path: str) -> Optional[Dict[str, Any]]:
+    """Video/audio stream details for a clip (see metadata.ffprobe_video), cached per file.
+
+    None if the file has no readable video stream.
+    """
+    info = media_info(path)
+    return info if info and info.get("kind") == "video" else None
+
+
+def _target_profile(probes: List[Optional[Dict[str, Any]]], audio: bool = False) -> Dict[str, Any]:
+    """Pick the common format: 1280x720 H.264 yuv420p at the inputs' most common fps/timebase.
+
+    With `audio`, every clip also carries a 48 kHz stereo AAC track.
+    """
+    usable = [p for p in probes if p]
+    fps = Counter(p["fps"] for p in usable if p.get("fps")).most_common(1)
+    target = {
+        "codec": TARGET_CODEC,
+        "width": TARGET_WIDTH,
+        "height": TARGET_HEIGHT,
+        "pix_fmt": TARGET_PIX_FMT,
+        "sar": "1:1",
+        "fps": fps[0][0] if fps else DEFAULT_FPS,
+    }
+    # Profile and time base are taken from clips that already conform, so re-encoded clips join them
+    conforming = [p for p in usable if _matches_frame_format(p, target)]
+    profiles = Counter(p["profile"] for p in conforming if p.get("profile")).most_common(1)
+    time_bases = Counter(p["time_base"] for p in conforming if p.get("time_base")).most_common(1)
+    target["profile"] = profiles[0][0] if profiles else "High"
+    target["time_base"] = time_bases[0][0] if time_bases else f"1/{DEFAULT_TIMESCALE}"
+    target["audio"] = dict(TARGET_AUDIO) if audio else None
+    return target
+
+
+def _matches_frame_format(probe: Dict[str, Any], target: Dict[str, Any]) -> bool:
+    return all(probe.get(k) == target[k] for k in ("codec", "width", "height", "pix_fmt", "sar", "fps"))
+
+
+def _video_matches(probe: Optional[Dict[str, Any]], target: Dict[str, Any]) -> bool:
+    return (
+        probe is not None
+        and _matches_frame_format(probe, target)
+        and probe.get("profile") == target["profile"]
+        and probe.get("time_base") == target["time_base"]
+    )
+
+
+def _audio_matches(probe: Optional[Dict[str, Any]], target: Dict[str, Any]) -> bool:
+    return target.get("audio") is None or (probe is not None and probe.get("audio") == target["audio"])
+
+
+def matches_target(probe: Optional[Dict[str, Any]], target: Dict[str, Any]) -> bool:
+    """True if a clip can be stream-copied into a concat with `target`'s format."""
+    return _video_matches(probe, target) and _audio_matches(probe, target)
+
+
+def normalize_clip(input_path: str, output_path: str, target: Dict[str, Any],
+                   probe: Optional[Dict[str, Any]] = None, threads: int = 0):
+    """Convert one clip to `target`'s format in a single ffmpeg pass.
+
+    Video is re-encoded to the target resolution, frame rate, profile and
+    time base, with SPS/PPS repeated in-band so the clip still decodes when
+    concatenated behind stream-copied clips from another encoder. If the
+    video already matches (per `probe`) it is copied, with its headers
+    likewise written in-band, and only the audio is touched. When the target has audio, the clip's track is resampled to
+    48 kHz stereo AAC and padded or trimmed to the video's length; a silent
+    clip gets generated silence. `threads` caps the encoder's threads
+    (0 = ffmpeg's default of one per core).
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails.
+    """
+    target_audio = target.get("audio")
+    has_audio = bool(probe and probe.get("audio"))
+
+    cmd = ["ffmpeg", "-y", "-i", os.path.abspath(input_path)]
+    if target_audio and not has_audio:
+        layout = "stereo" if target_audio["channels"] == 2 else "mono"
+        cmd.extend(["-f", "lavfi", "-i", f"anullsrc=channel_layout={layout}:sample_rate={target_audio['sample_rate']}"])
+    cmd.extend(["-map", "0:v:0"])
+
+    if _video_matches(probe, target):
+        cmd.extend(["-c:v", "copy", "-bsf:v", INBAND_HEADERS_BSF])
+    else:
+        vf = (
+            f"scale={target['width']}:{target['height']}:force_original_aspect_ratio=decrease,"
+            f"pad={target['width']}:{target['height']}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={target['fps']}"
+        )
+        cmd.extend([
+            "-vf", vf,
+            "-c:v", "libx264", "-crf", "18", "-preset", "fast",
+            "-pix_fmt", target["pix_fmt"],
+            "-x264-params", "repeat-headers=1",
+            "-threads", str(threads),
+        ])
+        profile = (target.get("profile") or "").lower()
+        if profile in ("baseline", "main", "high"):
+            cmd.extend(["-profile:v", profile])
+    cmd.extend(["-video_track_timescale", target["time_base"].split("/")[-1]])
+
+    if target_audio:
+        cmd.extend([
+            "-map", "0:a:0" if has_audio else "1:a:0",
+            "-af", "apad",
+            "-c:a", "aac", "-b:a", "192k",
+            "-ar", str(target_audio["sample_rate"]), "-ac", str(target_audio["channels"]),
+            "-shortest",
+        ])
+    cmd.append(output_path)
+    subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def default_mezzanine_dir() -> str:
+    """``<directories.output>/cache/mezzanine`` from config."""
+    from directors_chair.config.loader import load_config
+    output_dir = load_config().get("directories", {}).get("output", "assets/generated")
+    return os.path.join(output_dir, "cache", "mezzanine")
+
+
+def mezzanine_path(source_path: str, target: Dict[str, Any], cache_dir: str) -> str:
+    """Cache path of `source_path` normalized to `target`, keyed by content hash and profile."""
+    profile_key = text_sha256(
+        NORMALIZE_VERSION,
+        *(target[k] for k in ("codec", "profile", "width", "height", "pix_fmt", "sar", "fps", "time_base", "audio")),
+    )[:12]
+    return os.path.join(cache_dir, f"{file_sha256(source_path)}_{profile_key}.mp4")
+
+
+def ensure_mezzanine(source_path: str, target: Dict[str, Any], cache_dir: str,
+                     probe: Optional[Dict[str, Any]] = None, threads: int = 0) -> str:
+    """Path to a normalized copy of `source_path`, encoding it only if it isn't cached.
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails.
+    """
+    path = mezzanine_path(source_path, target, cache_dir)
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        os.utime(path)  # mark as recently used for prune_mezzanines
+        return path
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{os.path.splitext(path)[0]}.{os.getpid()}.tmp.mp4"
+    try:
+        normalize_clip(source_path, tmp_path, target, probe, threads)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+def remux_with_headers(input_path: str, output_path: str, target: Dict[str, Any]):
+    """Stream-copy a clip that already matches `target`, writing SPS/PPS in-band.
+
+    A copied clip normally keeps its parameter sets only in the MP4 header,
+    which the concat output takes from its first input; behind a mezzanine
+    from another encoder, the decoder would apply that encoder's headers to
+    it. Repeating them before each keyframe keeps every part self-describing.
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails.
+    """
+    subprocess.check_call([
+        "ffmpeg", "-y", "-i", os.path.abspath(input_path),
+        "-map", "0:v:0", *(["-map", "0:a:0"] if target.get("audio") else []),
+        "-c", "copy", "-bsf:v", INBAND_HEADERS_BSF,
+        "-video_track_timescale", target["time_base"].split("/")[-1],
+        output_path,
+    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def default_mezzanine_cache_bytes() -> int:
+    """system.mezzanine_cache_gb from config, in bytes (0 = unlimited)."""
+    from directors_chair.config.loader import load_config
+    gb = load_config().get("system", {}).get("mezzanine_cache_gb", DEFAULT_MEZZANINE_CACHE_GB)
+    return int(float(gb or 0) * 1024 ** 3)
+
+
+def prune_mezzanines(cache_dir: str, max_bytes: int, keep: Optional[List[str]] = None) -> int:
+    """Delete least recently used mezzanines until `cache_dir` fits in `max_bytes`.
+
+    Mezzanines are touched whenever they are reused, so the oldest mtime is
+    the one no recent cut has needed. Paths in `keep` (the cut just made)
+    are never deleted. Returns the number of bytes freed.
+    """
+    if max_bytes <= 0 or not os.path.isdir(cache_dir):
+        return 0
+    keep_paths = {os.path.abspath(p) for p in keep or []}
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith(".mp4") and ".tmp." not in entry.name:
+            st = entry.stat()
+            entries.append((st.st_mtime, st.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    freed = 0
+    for _, size, path in sorted(entries):
+        if total - freed <= max_bytes:
+            break
+        if os.path.abspath(path) in keep_paths:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        freed += size
+    return freed
+
+
+def _concat_list_entry(path: str) -> str:
+    escaped = os.path.abspath(path).replace("'", "'\\''")
+    return f"file '{escaped}'\n"
+
+
+def default_ffmpeg_workers() -> int:
+    """system.ffmpeg_workers from config."""
+    from directors_chair.config.loader import load_config
+    return int(load_config().get("system", {}).get("ffmpeg_workers", DEFAULT_FFMPEG_WORKERS))
+
+
+def concat_clips(clip_paths: List[str], output_path: str, cache_dir: Optional[str] = None,
+                 audio: Optional[bool] = None, max_workers: Optional[int] = None):
+    """Concatenate clips into one 1280x720 H.264 video, re-encoding only what doesn't match.
+
+    Every input is probed; clips that already share the target codec,
+    profile, resolution, pixel format, frame rate and time base are joined
+    with the concat demuxer and ``-c copy``. The rest are normalized to that
+    format once and kept as mezzanines in `cache_dir`, so re-cutting a
+    movie only encodes clips that are new or changed. When copied clips and
+    mezzanines are mixed, the copied clips are first remuxed with their
+    SPS/PPS in-band (see remux_with_headers) so each decodes with its own. Clips are encoded by
+    up to `max_workers` ffmpeg processes at once, each limited to its share
+    of the CPU cores. The output is written
+    to a temp file and renamed into place, so a failed run never leaves a
+    partial video.
+
+    With audio, every part carries a 48 kHz stereo AAC track (silence for
+    clips without one) so the concat can copy audio along with video.
+
+    Args:
+        clip_paths: Input clips, in order.
+        output_path: Final .mp4 path.
+        cache_dir: Mezzanine cache (defaults to ``<output>/cache/mezzanine``),
+            pruned to system.mezzanine_cache_gb after each cut.
+        audio: Carry audio through. None keeps audio if any input has it.
+        max_workers: Parallel ffmpeg encodes (default: system.ffmpeg_workers).
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails.
+    """
+    from directors_chair.cli.utils import console
+
+    probes = [probe_video(cp) for cp in clip_paths]
+    if audio is None:
+        audio = any(p and p.get("audio") for p in probes)
+    target = _target_profile(probes, audio=audio)
+    mismatched = [i for i, p in enumerate(probes) if not matches_target(p, target)]
+
+    parts = list(clip_paths)
+    if mismatched:
+        cache_dir = cache_dir or default_mezzanine_dir()
+        # The same clip can appear several times in a movie; encode it once
+        sources: Dict[str, int] = {}
+        for i in mismatched:
+            parts[i] = mezzanine_path(clip_paths[i], target, cache_dir)
+            sources.setdefault(parts[i], i)
+        to_encode = [i for path, i in sources.items() if not os.path.exists(path)]
+        for path in sources:
+            if os.path.exists(path):
+                os.utime(path)  # mark as recently used for prune_mezzanines
+
+        fmt = f"{target['width']}x{target['height']} @ {target['fps']}" + (" + 48k stereo audio" if audio else "")
+        console.print(f"  [dim]{len(mismatched)} of {len(clip_paths)} clips need {fmt} "
+                      f"({len(sources) - len(to_encode)} cached, {len(to_encode)} to encode); stream-copying the rest[/dim]")
+        if to_encode:
+            if max_workers is None:
+                max_workers = default_ffmpeg_workers()
+            workers = max(1, min(int(max_workers), len(to_encode)))
+            threads = max(1, (os.cpu_count() or 1) // workers) if workers > 1 else 0
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ffmpeg") as pool:
+                futures = [
+                    pool.submit(ensure_mezzanine, clip_paths[i], target, cache_dir, probes[i], threads)
+                    for i in to_encode
+                ]
+                for future in futures:
+                    future.result()
+    else:
+        console.print(f"  [dim]All {len(clip_paths)} clips match — joining without re-encoding[/dim]")
+
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    base, ext = os.path.splitext(output_path)
+    tmp_output = f"{base}.tmp{ext or '.mp4'}"
+
+    with tempfile.TemporaryDirectory(prefix="dc_concat_", dir=output_dir) as tmp_dir:
+        needs_mezzanine = set(mismatched)
+        copied = [i for i in range(len(clip_paths)) if i not in needs_mezzanine]
+        if mismatched and copied:
+            remuxed: Dict[str, str] = {}
+            for i in copied:
+                remuxed.setdefault(clip_paths[i], os.path.join(tmp_dir, f"copy_{len(remuxed)}.mp4"))
+                parts[i] = remuxed[clip_paths[i]]
+            workers = max(1, min(int(max_workers or default_ffmpeg_workers()), len(remuxed)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ffmpeg") as pool:
+                futures = [pool.submit(remux_with_headers, src, dst, target) for src, dst in remuxed.items()]
+                for future in futures:
+                    future.result()
+
+        list_path = os.path.join(tmp_dir, "concat.txt")
+        with open(list_path, "w") as f:
+            f.writelines(_concat_list_entry(p) for p in parts)
+
+        try:
+            subprocess.check_call([
+                "ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_path,
+                "-map", "0:v:0", *(["-map", "0:a:0"] if audio else []),
+                "-c", "copy", "-movflags", "+faststart",
+                tmp_output,
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            os.replace(tmp_output, output_path)
+        finally:
+            if os.path.exists(tmp_output):
+                os.remove(tmp_output)
+
+    if mismatched:
+        freed = prune_mezzanines(cache_dir, default_mezzanine_cache_bytes(), keep=[parts[i] for i in mismatched])
+        if freed:
+            console.print(f"  [dim]Pruned {freed // (1024 * 1024)}MB of old mezzanines from {cache_dir}[/dim]")
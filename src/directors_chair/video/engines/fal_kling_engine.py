@@ -1,9 +1,9 @@
 import os
 import re
-import requests
 from typing import Dict, Any, List, Optional, Tuple
 
-import fal_client
+from directors_chair.fal import download_file, run_job, upload_files
+from directors_chair.video.metadata import index_media
 
 
 def _resolve_voices(
@@ -104,9 +104,11 @@ class FalKlingEngine:
         resolved_beats, voice_ids = _resolve_voices(beats, characters)
         use_voices = len(voice_ids) > 0
 
-        # Upload start keyframe
+        # Upload start keyframe (and character references in elements mode) concurrently
+        char_names = [] if use_voices else list(characters.keys())
+        upload_paths = [start_image_path] + [characters[c]["reference_image"] for c in char_names]
         with console.status("[cyan]Uploading start keyframe...[/cyan]"):
-            start_url = fal_client.upload_file(start_image_path)
+            start_url, *ref_urls = upload_files(upload_paths)
 
         # Build multi_prompt — ensure duration is string
         multi_prompt = []
@@ -138,10 +140,7 @@ class FalKlingEngine:
         else:
             # Elements mode — O3 with character references, no audio
             elements = []
-            for char_name, char_def in characters.items():
-                ref_path = char_def["reference_image"]
-                with console.status(f"[cyan]Uploading {char_name} reference...[/cyan]"):
-                    ref_url = fal_client.upload_file(ref_path)
+            for ref_url in ref_urls:
                 elements.append({
                     "frontal_image_url": ref_url,
                     "reference_image_urls": [ref_url],
@@ -161,12 +160,10 @@ class FalKlingEngine:
         # Submit to Kling
         label = "V3 Pro (voice)" if use_voices else "O3 (elements)"
         with console.status(f"[cyan]Generating video via Kling {label}...[/cyan]") as status:
-            handler = fal_client.submit(endpoint, arguments=arguments)
-            for event in handler.iter_events(with_logs=True):
-                if isinstance(event, fal_client.InProgress) and event.logs:
-                    for log in event.logs:
-                        status.update(f"[cyan]{log.get('message', '')}[/cyan]")
-            result = handler.get()
+            result = run_job(
+                endpoint, arguments,
+                on_log=lambda msg: status.update(f"[cyan]{msg}[/cyan]"),
+            )
 
         # Extract video URL
         result_url = result.get("video", {}).get("url")
@@ -179,12 +176,8 @@ class FalKlingEngine:
 
         # Download video
         console.print("  [dim]Downloading video...[/dim]")
-        response = requests.get(result_url, stream=True)
-        downloaded = 0
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                downloaded += len(chunk)
+        downloaded = download_file(result_url, output_path)
+        index_media(output_path)
 
         console.print(f"  [green]Video saved: {os.path.basename(output_path)} ({downloaded // 1024}KB)[/green]")
         return True
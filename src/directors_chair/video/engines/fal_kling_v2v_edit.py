@@ -2,10 +2,10 @@ import os
 import subprocess
 import tempfile
 import time
-import requests
 from typing import Dict, Any, List, Optional
 
-import fal_client
+from directors_chair.fal import download_file, run_job, upload_files
+from directors_chair.video.metadata import index_media, media_info
 
 
 def _ensure_min_720p(video_path: str) -> str:
@@ -18,20 +18,11 @@ def _ensure_min_720p(video_path: str) -> str:
 
     Returns the path to use for upload (original if already >=720p, or a temp file).
     """
-    probe = subprocess.run(
-        ["ffprobe", "-v", "error", "-select_streams", "v:0",
-         "-show_entries", "stream=width,height", "-of", "csv=p=0", video_path],
-        capture_output=True, text=True
-    )
-    if probe.returncode != 0:
-        return video_path
-
-    parts = probe.stdout.strip().split(",")
-    if len(parts) != 2:
+    info = media_info(video_path)
+    if not info or not info.get("height"):
         return video_path
 
-    width, height = int(parts[0]), int(parts[1])
-    if height >= 720:
+    if info["height"] >= 720:
         return video_path
 
     # Scale to 1280x720, pad if needed
@@ -77,10 +68,12 @@ def edit_clip(
     if scaled:
         console.print("  [dim]Scaled clip to 720p for API compatibility[/dim]")
 
-    # Upload video
+    # Upload video and character references concurrently
+    char_names = list(characters.keys()) if characters else []
+    upload_paths = [upload_path] + [characters[c]["reference_image"] for c in char_names]
     try:
         with console.status("[cyan]Uploading video clip...[/cyan]"):
-            video_url = fal_client.upload_file(upload_path)
+            video_url, *ref_urls = upload_files(upload_paths)
         console.print(f"  [dim]Video uploaded ({os.path.getsize(upload_path) // 1024}KB)[/dim]")
     finally:
         # Clean up temp file if we created one
@@ -89,16 +82,12 @@ def edit_clip(
 
     # Build elements from characters
     elements = []
-    if characters:
-        for char_name, char_def in characters.items():
-            ref_path = char_def["reference_image"]
-            with console.status(f"[cyan]Uploading {char_name} reference...[/cyan]"):
-                ref_url = fal_client.upload_file(ref_path)
-            elements.append({
-                "frontal_image_url": ref_url,
-                "reference_image_urls": [ref_url],
-            })
-            console.print(f"  [dim]{char_name}: uploaded[/dim]")
+    for char_name, ref_url in zip(char_names, ref_urls):
+        elements.append({
+            "frontal_image_url": ref_url,
+            "reference_image_urls": [ref_url],
+        })
+        console.print(f"  [dim]{char_name}: uploaded[/dim]")
 
     # Enforce API constraint: max 4 elements — truncate silently
     if len(elements) > 4:
@@ -124,16 +113,11 @@ def edit_clip(
     for attempt in range(max_retries):
         try:
             with console.status("[cyan]Editing video via Kling O3 v2v...[/cyan]") as status:
-                handler = fal_client.submit(
+                result = run_job(
                     "fal-ai/kling-video/o1/video-to-video/edit",
-                    arguments=arguments,
+                    arguments,
+                    on_log=lambda msg: status.update(f"[cyan]{msg}[/cyan]"),
                 )
-                for event in handler.iter_events(with_logs=True):
-                    if isinstance(event, fal_client.InProgress) and event.logs:
-                        for log in event.logs:
-                            msg = log.get("message", "") if isinstance(log, dict) else str(log)
-                            status.update(f"[cyan]{msg}[/cyan]")
-                result = handler.get()
                 break
         except Exception as e:
             err_str = str(e)
@@ -166,12 +150,8 @@ def edit_clip(
 
     # Download
     console.print("  [dim]Downloading edited video...[/dim]")
-    response = requests.get(result_url, stream=True)
-    downloaded = 0
-    with open(output_path, "wb") as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
-            downloaded += len(chunk)
+    downloaded = download_file(result_url, output_path)
+    index_media(output_path)
 
     console.print(f"  [green]Edited clip saved: {os.path.basename(output_path)} ({downloaded // 1024}KB)[/green]")
     return True
@@ -1,7 +1,6 @@
-from .engines.fal_kling_engine import FalKlingEngine
-
+# Engines are imported on first use; they pull in fal_client
 VIDEO_ENGINES = {
-    "kling-o3": ("Kling O3 Image-to-Video (fal.ai)", FalKlingEngine),
+    "kling-o3": "Kling O3 Image-to-Video (fal.ai)",
 }
 
 DEFAULT_ENGINE = "kling-o3"
@@ -9,4 +8,5 @@ DEFAULT_ENGINE = "kling-o3"
 
 def get_kling_engine(kling_params=None):
     """Get a Kling video engine instance."""
+    from .engines.fal_kling_engine import FalKlingEngine
     return FalKlingEngine(kling_params=kling_params)
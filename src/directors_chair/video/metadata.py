@@ -0,0 +1,184 @@
+import json
+import os
+import subprocess
+import threading
+from typing import Any, Dict, Optional
+
+INDEX_NAME = ".media_index.json"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+
+def ffprobe_video(path: str) -> Optional[Dict[str, Any]]:
+    """Describe the first video and audio streams of `path` via ffprobe.
+
+    Returns:
+        Dict with kind "video", codec, profile, width, height, pix_fmt, sar,
+        fps and time_base (ffprobe's strings, e.g. fps "24/1", time_base
+        "1/12288"), duration in seconds, plus audio: {codec, sample_rate,
+        channels} or None for a silent clip. None if the file has no
+        readable video stream.
+    """
+    proc = subprocess.run(
+        ["ffprobe", "-v", "error",
+         "-show_entries", "stream=codec_type,codec_name,profile,width,height,pix_fmt,"
+                          "sample_aspect_ratio,r_frame_rate,time_base,sample_rate,channels:format=duration",
+         "-of", "json", path],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        return None
+    try:
+        data = json.loads(proc.stdout)
+    except ValueError:
+        return None
+    streams = data.get("streams", [])
+
+    video = next((st for st in streams if st.get("codec_type") == "video"), None)
+    if video is None:
+        return None
+    audio = next((st for st in streams if st.get("codec_type") == "audio"), None)
+
+    try:
+        duration = float(data.get("format", {}).get("duration"))
+    except (TypeError, ValueError):
+        duration = None
+
+    sar = video.get("sample_aspect_ratio") or "1:1"
+    return {
+        "kind": "video",
+        "codec": video.get("codec_name"),
+        "profile": video.get("profile"),
+        "width": video.get("width"),
+        "height": video.get("height"),
+        "pix_fmt": video.get("pix_fmt"),
+        "sar": "1:1" if sar in ("0:1", "N/A") else sar,
+        "fps": video.get("r_frame_rate"),
+        "time_base": video.get("time_base"),
+        "duration": duration,
+        "audio": {
+            "codec": audio.get("codec_name"),
+            "sample_rate": audio.get("sample_rate"),
+            "channels": audio.get("channels"),
+        } if audio else None,
+    }
+
+
+def image_dimensions(path: str) -> Optional[Dict[str, Any]]:
+    """{kind: "image", width, height, format} read from the image header, or None."""
+    from PIL import Image
+    try:
+        with Image.open(path) as img:
+            return {"kind": "image", "width": img.width, "height": img.height, "format": img.format}
+    except (OSError, ValueError):
+        return None
+
+
+def _read_media(path: str) -> Optional[Dict[str, Any]]:
+    if path.lower().endswith(IMAGE_EXTENSIONS):
+        return image_dimensions(path)
+    return ffprobe_video(path)
+
+
+class MediaIndex:
+    """Cached ffprobe results and image dimensions for one directory tree.
+
+    Stored as ``.media_index.json`` in the storyboard's output directory and
+    keyed by path relative to it. An entry is reused while the file's mtime
+    and size are unchanged, so listings and pre-flight checks don't spawn
+    ffprobe for clips that were already inspected.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.path = os.path.join(root, INDEX_NAME)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    self._entries = json.load(f).get("files", {})
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), os.path.abspath(self.root))
+
+    def _write(self):
+        # Drop entries for files that have since been deleted
+        self._entries = {
+            k: v for k, v in self._entries.items() if os.path.exists(os.path.join(self.root, k))
+        }
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"files": self._entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def get(self, path: str, probe: bool = True) -> Optional[Dict[str, Any]]:
+        """Metadata for `path` (see ffprobe_video / image_dimensions), or None if unreadable.
+
+        With `probe` False, only a cached entry is returned (None on a miss),
+        so callers such as listings never spawn ffprobe or rewrite the index.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = self._key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+                return entry.get("info")
+        if not probe:
+            return None
+
+        info = _read_media(path)
+        with self._lock:
+            self._entries[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "info": info}
+            self._write()
+        return info
+
+
+_indexes: Dict[str, MediaIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_media_index(root: str) -> MediaIndex:
+    """Shared MediaIndex for a directory (one per process)."""
+    root = os.path.abspath(root)
+    with _indexes_lock:
+        if root not in _indexes:
+            _indexes[root] = MediaIndex(root)
+        return _indexes[root]
+
+
+def index_root_for(path: str) -> str:
+    """Directory whose index covers `path`.
+
+    Files under ``<videos>/<storyboard>/`` share that storyboard's index;
+    anything else is indexed in its own directory.
+    """
+    from directors_chair.config.loader import load_config
+    videos_dir = os.path.abspath(load_config().get("directories", {}).get("videos", "assets/generated/videos"))
+    path = os.path.abspath(path)
+    rel = os.path.relpath(path, videos_dir)
+    parts = rel.split(os.sep)
+    if not rel.startswith("..") and len(parts) > 1:
+        return os.path.join(videos_dir, parts[0])
+    return os.path.dirname(path)
+
+
+def media_info(path: str, probe: bool = True) -> Optional[Dict[str, Any]]:
+    """Cached metadata for a clip or image (see MediaIndex.get)."""
+    return get_media_index(index_root_for(path)).get(path, probe=probe)
+
+
+def index_media(path: str):
+    """Record a clip or image the pipeline just wrote, so listings show its details.
+
+    Best effort: if ffprobe is missing the file is simply left unindexed.
+    """
+    try:
+        media_info(path)
+    except OSError:
+        pass